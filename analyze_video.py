@@ -1,5 +1,8 @@
 import sys
 import time
+_IMPORT_START = time.perf_counter()
+import threading
+import tempfile
 import warnings
 import logging
 import os
@@ -14,15 +17,16 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 os.environ['HF_HUB_DISABLE_TELEMETRY'] = '1'
 os.environ['TRANSFORMERS_VERBOSITY'] = 'error'
 
-from vision.pose_detector import PoseAnalyzer
-from vision.skin_detector import detect_skin_ratio
-from vision.blood_detector import detect_blood
-from vision.fire_detector import detect_fire
-from vision.human_segmenter import detect_human
+from vision.pose_pool import get_pose_pool
+from vision.frame_detectors import detect_frames
+from vision.vision_pool import VISION_EXECUTORS, get_vision_pool
 
-from stage0_sampling.smart_sampler import smart_sample
-from stage1_fast_filter.motion_filter import fast_filter, motion_risk_score
+from stage0_sampling.smart_sampler import smart_sample_stream
+from stage0_sampling.motion_timeline import MotionTimeline
+from stage1_fast_filter.motion_filter import fast_filter
 from stage2_vision.blip_only import detect_objects_blip_only, classify_scene_blip_only
+from stage2_vision.blip_scene import load_inference_config
+from stage2_vision.blip_cascade import BlipCascade
 from stage3_temporal.temporal_brain import TemporalBrain
 from stage6_audio.audio_utils import extract_audio
 from stage6_audio.audio_analyzer import analyze_audio
@@ -31,27 +35,100 @@ from signals.signals_builder import build_signals
 from policy_engine.evaluator import evaluate_policies
 from policy_engine.aggregator import aggregate_risks
 
+from cache.decision_cache import decision_key, file_fingerprint, get_decision_cache
+from budget.latency_budget import LatencyBudget, record_cost
+from budget.thread_budget import get_thread_budget
+from worker.protocol import print_result
 
-def analyze_video(video_path):
-    """Optimized video analysis with parallel processing - preserves original behavior"""
+# Heavy dependencies (torch, transformers, mediapipe, faster-whisper) are
+# imported on first use by the modules above, not here
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
+
+BLIP_BATCH_SIZE = 4   # Frames captioned together while decoding continues
+DETECTOR_BATCH_SIZE = 16  # Most frames per vision task, reached only while every vision worker is busy
+
+
+def _blip_batch(frames):
+    """Run BLIP object detection and scene classification on one batch"""
+    batch_start = time.time()
+    risky_objects, safe_objects = detect_objects_blip_only(frames)
+    scene_results, scene_types = classify_scene_blip_only(frames)
+    record_cost("blip_per_frame", (time.time() - batch_start) / len(frames))
+    return risky_objects, safe_objects, scene_results, scene_types
+
+
+def analyze_video(video_path, use_cache=True, budget=None, blip_mode=None, vision_executor=None):
+    """
+    Optimized video analysis with parallel processing - preserves original behavior
+
+    budget is an optional latency target in seconds; the number of sampled
+    frames and whether audio runs are planned from measured stage costs,
+    and actual vs budgeted time is returned under explanation["latency"].
+
+    blip_mode is "cascade" (caption shot representatives and frames with
+    suspicious cheap signals) or "all" (caption every frame); None uses
+    config/inference.json.
+
+    vision_executor is "threads" (per-frame detectors on this process's
+    frame threads) or "processes" (on the shared VisionProcessPool); None
+    uses config/inference.json. With threads, pose runs on analyzers
+    checked out of the process-wide PosePool, so concurrent analyses
+    (e.g. in the worker daemon) reuse warm MediaPipe graphs instead of
+    creating one per video.
+    """
     start_time = time.time()
     print("\n📥 Loading video:", video_path)
+    config = load_inference_config()
+    cascade = BlipCascade(blip_mode or config["blip_mode"])
+    vision_executor = vision_executor or config["vision_executor"]
+    if vision_executor not in VISION_EXECUTORS:
+        raise ValueError(f"Unknown vision executor: {vision_executor!r} (expected one of {VISION_EXECUTORS})")
+    thread_budget = get_thread_budget()
 
-    # ---------------- STAGE 0 ----------------
-    frames = smart_sample(video_path)
-    print(f"🎞️  Stage 0: Selected {len(frames)} key frames")
+    latency_budget = None
+    max_frames, run_audio = None, True
+    if budget is not None:
+        latency_budget = LatencyBudget(budget, vision_workers=thread_budget.frame_workers())
+        max_frames, run_audio = latency_budget.plan()
+        print(f"⏳ Budget {budget}s: up to {max_frames} frames, audio {'on' if run_audio else 'off'}")
 
-    # ---------------- STAGE 1 ----------------
-    fast_flag, fast_info = fast_filter(frames)
-    print(f"⚡ Stage 1: Fast suspicious =", fast_flag, fast_info)
+    # ---------------- DECISION CACHE ----------------
+    cache_key = None
+    if use_cache:
+        try:
+            cache_key = decision_key(
+                file_fingerprint(video_path),
+                max_frames=max_frames, audio=run_audio,
+                blip_mode=cascade.mode, blip_backend=config["blip_backend"]
+            )
+            cached = get_decision_cache().get(cache_key)
+        except Exception as e:
+            print(f"⚠️  Decision cache unavailable: {str(e)}")
+            cache_key, cached = None, None
+
+        if cached is not None:
+            decision, explanation, _ = cached
+            print("💾 Cache hit:", cache_key)
+            if latency_budget is not None:
+                explanation["latency"] = latency_budget.report(time.time() - start_time, 0, False)
+            print_result(decision, explanation, time.time() - start_time)
+            return decision, explanation
 
     brain = TemporalBrain(window_size=5)
 
     all_risky_objects = set()
     all_safe_objects = set()
     all_scene_labels = []
+    scene_types = {"kitchen": False, "outdoor": False, "indoor": False}
 
-    pose_analyzer = PoseAnalyzer()
+    # Frame threads either run the detectors or hand batches to worker
+    # processes; both fail here, as before, if MediaPipe cannot load
+    if vision_executor == "processes":
+        detect = get_vision_pool().detect
+    else:
+        pose_pool = get_pose_pool()
+        pose_pool.warm(1)
+        detect = lambda frames: detect_frames(frames, pose_pool)
     pose_signals = {
         "human_present": False,
         "hands_detected": False,
@@ -65,92 +142,167 @@ def analyze_video(video_path):
     fire_detected = False
     human_detected = False
 
-    # ---------------- FRAME PROCESSING (OPTIMIZED) ----------------
-    print("🔄 Processing frames with parallel vision analysis...")
-    
     all_motion_scores = []
     all_pose_data = []
     all_skin_ratios = []
     
     # Process frames in parallel for vision tasks
-    def process_frame_vision(frame_data):
-        frame, idx = frame_data
-        results = {}
-        
-        try:
-            # Process vision tasks for this frame
-            results['motion'] = motion_risk_score([frame])
-            results['pose'] = pose_analyzer.analyze(frame)
-            results['skin_ratio'] = detect_skin_ratio(frame)
-            results['blood'] = detect_blood(frame)
-            results['fire'] = detect_fire(frame)
-            results['human'] = detect_human(frame)
-            
+    def process_frame_vision(frame, idx, motion, detections):
+        if detections is not None:
+            results = dict(detections, motion=motion)  # Motion measured by stage 0
             print(f"✅ Frame {idx} processed")
             
-        except Exception as e:
-            print(f"⚠️  Error processing frame {idx}: {str(e)}")
+            if cascade.admit_signals(idx, results):
+                queue_blip(frame)
+        else:
+            print(f"⚠️  Error processing frame {idx}")
             # Set defaults
             results = {
-                'motion': 0.0,
+                'motion': motion,
                 'pose': {},
                 'skin_ratio': 0.0,
                 'blood': False,
                 'fire': False,
                 'human': False
             }
+            if cascade.admit_signals(idx, None):
+                queue_blip(frame)
         
         return results
-    
-    # Process frames in parallel
-    max_workers = min(len(frames), 4)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        frame_futures = {
-            executor.submit(process_frame_vision, (frame, i)): i 
-            for i, frame in enumerate(frames)
-        }
-        
+
+    def process_batch_vision(batch):
+        # Colour detectors run vectorized over the batch; pose stays per frame
+        batch_start = time.time()
+        try:
+            all_detections = detect([frame for frame, _, _ in batch])
+        except Exception as e:
+            print(f"⚠️  Error in vision workers: {str(e)}")
+            all_detections = [None] * len(batch)
+
+        results = [
+            process_frame_vision(frame, idx, motion, detections)
+            for (frame, idx, motion), detections in zip(batch, all_detections)
+        ]
+        record_cost("detector_per_frame", (time.time() - batch_start) / len(batch))
+        return results
+
+    # ---------------- STAGE 0 (STREAMING) ----------------
+    # Frames go to the vision pool and the BLIP batch queue as soon as the
+    # sampler selects them (or, in cascade mode, once their cheap signals
+    # call for a caption), so inference overlaps with decoding
+    print("🔄 Streaming frames into parallel vision analysis and BLIP batches...")
+    frames = []
+    timeline = MotionTimeline()
+    frame_futures = {}
+    blip_futures = []
+    blip_batch = []
+    blip_lock = threading.Lock()
+
+    def queue_blip(frame, flush=False):
+        # Called from the stream loop and the vision workers
+        with blip_lock:
+            if frame is not None:
+                blip_batch.append(frame)
+            if blip_batch and (flush or len(blip_batch) >= BLIP_BATCH_SIZE):
+                blip_futures.append(blip_executor.submit(_blip_batch, list(blip_batch)))
+                blip_batch.clear()
+
+    vision_batch = []
+    in_flight = []
+
+    def submit_vision(batch):
+        future = executor.submit(process_batch_vision, batch)
+        frame_futures[future] = (batch[0][1], batch[-1][1])
+        return future
+
+    # The frame pool gets this video's share of the process core budget
+    with thread_budget.video() as vision_workers, \
+            ThreadPoolExecutor(max_workers=vision_workers) as executor, \
+            ThreadPoolExecutor(max_workers=1) as blip_executor:
+        for frame in smart_sample_stream(video_path, max_frames=max_frames, timeline=timeline):
+            idx = len(frames)
+            frames.append(frame)
+            if cascade.admit_sampled(idx, frame):
+                queue_blip(frame)
+            motion = timeline.motion_at(frame.index)
+
+            # Frames are handed over one at a time while a worker is idle,
+            # and batched for the vectorized detectors once all are busy
+            vision_batch.append((frame, idx, motion))
+            in_flight = [future for future in in_flight if not future.done()]
+            if len(in_flight) < vision_workers or len(vision_batch) >= DETECTOR_BATCH_SIZE:
+                in_flight.append(submit_vision(vision_batch))
+                vision_batch = []
+
+        if vision_batch:
+            submit_vision(vision_batch)
+
+        print(f"🎞️  Stage 0: Selected {len(frames)} key frames")
+
+        # ---------------- STAGE 1 ----------------
+        fast_flag, fast_info = fast_filter(frames, timeline=timeline)
+        brain.add_motion_timeline(timeline)
+        print(f"⚡ Stage 1: Fast suspicious =", fast_flag, fast_info)
+
+        if fast_flag:
+            # The whole video looks suspicious: caption the frames the cascade skipped
+            for idx in cascade.escalate():
+                queue_blip(frames[idx])
+
+        # ---------------- FRAME PROCESSING (OPTIMIZED) ----------------
+        # Batches finish in any order; results are keyed by frame so the
+        # temporal brain sees them in stream order
+        results_by_idx = {}
         for future in as_completed(frame_futures, timeout=60):
-            frame_idx = frame_futures[future]
+            first_idx, last_idx = frame_futures[future]
             try:
-                frame_results = future.result(timeout=15)
-                
-                # Collect results
-                all_motion_scores.append(frame_results['motion'])
-                all_pose_data.append(frame_results['pose'])
-                all_skin_ratios.append(frame_results['skin_ratio'])
-                
-                if frame_results['blood']:
-                    blood_detected = True
-                
-                if frame_results['fire']:
-                    fire_detected = True
-                
-                if frame_results['human']:
-                    human_detected = True
-                
-                # Add to temporal brain
-                brain.add_frame_result(
-                    motion_score=frame_results['motion'],
-                    risky_objects=[],
-                    safe_objects=[],
-                    clip_results=[]
-                )
-                
+                batch_results = future.result(timeout=15)
             except Exception as e:
-                print(f"⚠️  Timeout or error in frame {frame_idx}: {str(e)}")
+                print(f"⚠️  Timeout or error in frames {first_idx}-{last_idx}: {str(e)}")
                 continue
+            for idx, frame_results in enumerate(batch_results, first_idx):
+                results_by_idx[idx] = frame_results
+
+        for idx in sorted(results_by_idx):
+            frame_results = results_by_idx[idx]
+
+            # Collect results
+            all_motion_scores.append(frame_results['motion'])
+            all_pose_data.append(frame_results['pose'])
+            all_skin_ratios.append(frame_results['skin_ratio'])
+            
+            if frame_results['blood']:
+                blood_detected = True
+            
+            if frame_results['fire']:
+                fire_detected = True
+            
+            if frame_results['human']:
+                human_detected = True
+            
+            # Add to temporal brain
+            brain.add_frame_result(
+                motion_score=frame_results['motion'],
+                risky_objects=[],
+                safe_objects=[],
+                clip_results=[]
+            )
+
+        # ---------------- BATCH BLIP PROCESSING ----------------
+        queue_blip(None, flush=True)
+        summary = cascade.summary()
+        print(f"🧮 BLIP {summary['mode']}: captioning {summary['captioned']}/{summary['frames']} frames")
+        print("🚀 Collecting BLIP batch results...")
+        for future in blip_futures:
+            risky_objects, safe_objects, scene_results, batch_scene_types = future.result()
+
+            # Aggregate results
+            all_risky_objects.update(risky_objects)
+            all_safe_objects.update(safe_objects)
+            all_scene_labels.extend(scene_results)
+            for key, value in batch_scene_types.items():
+                scene_types[key] = scene_types.get(key, False) or value
 
-    # ---------------- BATCH BLIP PROCESSING ----------------
-    print("🚀 Processing frames with BLIP (TRUE BATCH MODE)...")
-    risky_objects, safe_objects = detect_objects_blip_only(frames)
-    all_scene_results, scene_types = classify_scene_blip_only(frames)
-    
-    # Aggregate results
-    all_risky_objects.update(risky_objects)
-    all_safe_objects.update(safe_objects)
-    all_scene_labels.extend(all_scene_results)
-    
     # Aggregate pose signals (ORIGINAL LOGIC)
     for pose in all_pose_data:
         for k in pose_signals:
@@ -160,9 +312,22 @@ def analyze_video(video_path):
     avg_skin = sum(all_skin_ratios) / len(all_skin_ratios) if all_skin_ratios else 0.0
 
     # ---------------- AUDIO ----------------
-    audio_path = extract_audio(video_path)
-    audio_score = analyze_audio(audio_path)["risk_score"] if audio_path else 0.0
-    print("🔊 Audio risk:", audio_score)
+    if run_audio:
+        audio_start = time.time()
+        # Per-run file so concurrent analyses (e.g. in the daemon) do not collide
+        fd, temp_audio = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            audio_path = extract_audio(video_path, temp_audio)
+            audio_score = analyze_audio(audio_path)["risk_score"] if audio_path else 0.0
+        finally:
+            os.remove(temp_audio)
+        if audio_path:
+            record_cost("audio", time.time() - audio_start)
+        print("🔊 Audio risk:", audio_score)
+    else:
+        audio_score = 0.0
+        print("🔇 Audio skipped to stay within budget")
 
     temporal_state = {
         "sustained": brain.intent_score() > 0.3,
@@ -191,18 +356,43 @@ def analyze_video(video_path):
     risks = evaluate_policies(signals)
     decision, explanation = aggregate_risks(risks)
 
-    print("\n================ FINAL RESULT ================")
-    print("📌 DECISION :", decision)
-    print("🧾 DETAILS  :", explanation)
-    print("⏱️  TIME    :", round(time.time() - start_time, 2), "seconds")
-    print("=============================================\n")
+    explanation = dict(explanation)
+    explanation["blip"] = cascade.summary()
+
+    # A run whose BLIP stage produced no captions is degraded (e.g. a
+    # transient model failure); it is not cached, so the next run retries
+    if cache_key is not None and all_scene_labels:
+        try:
+            get_decision_cache().put(cache_key, decision, explanation, signals)
+        except Exception as e:
+            print(f"⚠️  Could not cache decision: {str(e)}")
+    elif cache_key is not None:
+        print("⚠️  No BLIP captions; decision not cached")
+
+    if latency_budget is not None:
+        explanation["latency"] = latency_budget.report(time.time() - start_time, len(frames), run_audio)
+
+    print_result(decision, explanation, time.time() - start_time)
 
     return decision, explanation
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("❌ Usage: python analyze_video_optimized.py <video_path>")
+    args = [arg for arg in sys.argv[1:] if arg != "--startup-profile"]
+    if "--startup-profile" in sys.argv:
+        from profiling.startup_profile import print_startup_profile, profile_startup
+        print_startup_profile(profile_startup(IMPORT_SECONDS))
+        if not args:
+            sys.exit(0)
+
+    if not args:
+        print("❌ Usage: python analyze_video_optimized.py <video_path> [--no-cache] [--budget SECONDS] [--blip-all] "
+              "[--vision-processes] [--startup-profile]")
         sys.exit(1)
 
-    analyze_video(sys.argv[1])
+    sys.argv[1:] = args
+    options = sys.argv[2:]
+    budget = float(options[options.index("--budget") + 1]) if "--budget" in options else None
+    analyze_video(sys.argv[1], use_cache="--no-cache" not in options, budget=budget,
+                  blip_mode="all" if "--blip-all" in options else None,
+                  vision_executor="processes" if "--vision-processes" in options else None)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+⏱️ BLIP backend benchmark
+Compares captions and wall time of an inference backend against fp32 on a local clip set
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from stage0_sampling.smart_sampler import smart_sample
+from stage2_vision.blip_scene import BLIP_BACKENDS, batch_process_frames, get_blip_model
+from profiling.clips import clip_paths
+
+
+def token_agreement(a, b):
+    """Jaccard overlap of caption words"""
+    a_words, b_words = set(a.lower().split()), set(b.lower().split())
+    if not a_words and not b_words:
+        return 1.0
+    return len(a_words & b_words) / len(a_words | b_words)
+
+
+def timed_captions(frames, backend):
+    start = time.perf_counter()
+    captions = batch_process_frames(frames, backend, use_cache=False)
+    return captions, time.perf_counter() - start
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[2] not in BLIP_BACKENDS:
+        print(f"❌ Usage: python benchmark_blip.py <clip_dir> <{'|'.join(BLIP_BACKENDS)}>")
+        sys.exit(1)
+
+    clip_dir, backend = sys.argv[1], sys.argv[2]
+    clips = clip_paths(clip_dir)
+
+    # Load both models before timing anything
+    get_blip_model("fp32")
+    get_blip_model(backend)
+
+    base_time = test_time = 0.0
+    exact = total = 0
+    overlap = 0.0
+
+    for clip in clips:
+        frames = smart_sample(clip)
+        base_captions, base_seconds = timed_captions(frames, "fp32")
+        test_captions, test_seconds = timed_captions(frames, backend)
+        base_time += base_seconds
+        test_time += test_seconds
+
+        for base, test in zip(base_captions, test_captions):
+            total += 1
+            exact += base == test
+            overlap += token_agreement(base, test)
+            if base != test:
+                print(f"   ≠ fp32: {base!r}\n     {backend}: {test!r}")
+
+        print(f"🎬 {os.path.basename(clip)}: fp32 {base_seconds:.2f}s, {backend} {test_seconds:.2f}s")
+
+    print(f'\n⏱️  BLIP Backend Benchmark ({backend} vs fp32)')
+    print('=' * 50)
+    print(f'Clips / frames   : {len(clips)} / {total}')
+    print(f'fp32 time        : {base_time:.2f}s')
+    print(f'{backend} time'.ljust(17) + f': {test_time:.2f}s')
+    if test_time > 0:
+        print(f'Speedup          : {base_time / test_time:.2f}x')
+    if total:
+        print(f'Exact agreement  : {exact / total:.1%}')
+        print(f'Word overlap     : {overlap / total:.1%}')
+
+
+if __name__ == "__main__":
+    main()
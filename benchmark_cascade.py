@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+⏱️ BLIP cascade benchmark
+Compares decisions and BLIP calls of the cascade against captioning every frame on a local clip set
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from analyze_video import analyze_video
+from profiling.clips import clip_paths
+
+
+def run(clip, blip_mode):
+    start = time.perf_counter()
+    decision, explanation = analyze_video(clip, use_cache=False, blip_mode=blip_mode)
+    return decision, explanation["blip"]["captioned"], time.perf_counter() - start
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("❌ Usage: python benchmark_cascade.py <clip_dir>")
+        sys.exit(1)
+
+    clip_dir = sys.argv[1]
+    clips = clip_paths(clip_dir)
+
+    all_calls = cascade_calls = 0
+    all_time = cascade_time = 0.0
+    differing = []
+
+    for clip in clips:
+        all_decision, all_captioned, all_seconds = run(clip, "all")
+        cascade_decision, cascade_captioned, cascade_seconds = run(clip, "cascade")
+        all_calls += all_captioned
+        cascade_calls += cascade_captioned
+        all_time += all_seconds
+        cascade_time += cascade_seconds
+        if cascade_decision != all_decision:
+            differing.append((os.path.basename(clip), all_decision, cascade_decision))
+
+    print('\n⏱️  BLIP Cascade Benchmark (cascade vs all frames)')
+    print('=' * 50)
+    print(f'Clips               : {len(clips)}')
+    print(f'Captioned frames    : all {all_calls}, cascade {cascade_calls}')
+    print(f'Time                : all {all_time:.2f}s, cascade {cascade_time:.2f}s')
+    print(f'Decision agreement  : {len(clips) - len(differing)}/{len(clips)}')
+    for name, all_decision, cascade_decision in differing:
+        print(f'   ≠ {name}: all {all_decision!r}, cascade {cascade_decision!r}')
+
+
+if __name__ == "__main__":
+    main()
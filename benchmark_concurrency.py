@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+⏱️ Concurrency benchmark
+Throughput of analyze_video at 1, 2, 4 and 8 videos analysed at once in one process
+"""
+
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from analyze_video import analyze_video
+from budget.thread_budget import get_thread_budget
+from stage2_vision.blip_scene import get_blip_model
+from stage6_audio.audio_analyzer import get_whisper_model
+from profiling.clips import clip_paths
+
+CONCURRENCY_LEVELS = (1, 2, 4, 8)
+
+
+def run(clips, concurrency):
+    # Every level analyses the same number of videos, cycling through the clips
+    jobs = [clips[i % len(clips)] for i in range(max(CONCURRENCY_LEVELS))]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda clip: analyze_video(clip, use_cache=False), jobs))
+    return len(jobs), time.perf_counter() - start
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("❌ Usage: python benchmark_concurrency.py <clip_dir>")
+        sys.exit(1)
+
+    clip_dir = sys.argv[1]
+    clips = clip_paths(clip_dir)
+
+    # Load models before timing anything
+    get_blip_model()
+    try:
+        get_whisper_model()
+    except RuntimeError as e:
+        print(f"⚠️  {str(e)}")
+
+    results = [(concurrency, *run(clips, concurrency)) for concurrency in CONCURRENCY_LEVELS]
+
+    print('\n⏱️  Concurrency Benchmark')
+    print('=' * 50)
+    print(f'Thread budget : {get_thread_budget().report()}')
+    for concurrency, videos, seconds in results:
+        print(f'{concurrency} concurrent   : {videos} videos in {seconds:7.2f}s  '
+              f'({videos / seconds * 60:.1f} videos/min)')
+
+
+if __name__ == "__main__":
+    main()
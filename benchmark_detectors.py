@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+⏱️ Colour detector benchmark
+Compares the fused and batched colour detectors against the separate skin, blood and fire detectors on a local clip set
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from stage0_sampling.frame_packet import FramePacket
+from stage0_sampling.smart_sampler import smart_sample_stream
+from vision.skin_detector import detect_skin_ratio
+from vision.blood_detector import detect_blood
+from vision.fire_detector import detect_fire
+from vision.colour_detector import detect_colours, detect_colours_batch
+from analyze_video import DETECTOR_BATCH_SIZE
+from profiling.clips import clip_paths
+
+SKIN_TOLERANCE = 0.01
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("❌ Usage: python benchmark_detectors.py <clip_dir>")
+        sys.exit(1)
+
+    clip_dir = sys.argv[1]
+    clips = clip_paths(clip_dir)
+
+    frames = [packet.image for clip in clips for packet in smart_sample_stream(clip)]
+    if not frames:
+        print("❌ No frames sampled")
+        sys.exit(1)
+
+    # Fresh packets per run, so neither side reuses the other's colour planes
+    separate_time = fused_time = 0.0
+    differing = {"skin": 0, "blood": 0, "fire": 0}
+    for image in frames:
+        packet = FramePacket(image)
+        start = time.perf_counter()
+        skin, blood, fire = detect_skin_ratio(packet), detect_blood(packet), detect_fire(packet)
+        separate_time += time.perf_counter() - start
+
+        packet = FramePacket(image)
+        start = time.perf_counter()
+        colours = detect_colours(packet)
+        fused_time += time.perf_counter() - start
+
+        differing["skin"] += abs(colours.skin_ratio - skin) > SKIN_TOLERANCE
+        differing["blood"] += colours.blood != blood
+        differing["fire"] += colours.fire != fire
+
+    packets = [FramePacket(image) for image in frames]
+    start = time.perf_counter()
+    for i in range(0, len(packets), DETECTOR_BATCH_SIZE):
+        detect_colours_batch(packets[i:i + DETECTOR_BATCH_SIZE])
+    batched_time = time.perf_counter() - start
+
+    per_frame = 1000 / len(frames)
+    print('\n⏱️  Colour Detector Benchmark (fused vs separate)')
+    print('=' * 50)
+    print(f'Clips / frames      : {len(clips)} / {len(frames)}')
+    print(f'Time per frame      : separate {separate_time * per_frame:.2f}ms, fused {fused_time * per_frame:.2f}ms, '
+          f'batched {batched_time * per_frame:.2f}ms')
+    print(f'Speedup             : fused {separate_time / fused_time:.1f}x, batched {separate_time / batched_time:.1f}x')
+    for name, count in differing.items():
+        print(f'{name.capitalize():<20}: {len(frames) - count}/{len(frames)} frames agree')
+
+
+if __name__ == "__main__":
+    main()
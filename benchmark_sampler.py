@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+⏱️ Stage 0 sampler benchmark
+Compares the low-resolution proxy scoring path against full-resolution scoring
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from stage0_sampling.smart_sampler import smart_sample, PROXY_SIZE
+
+
+def run(video_path, proxy_size, mode):
+    start = time.perf_counter()
+    _, indices = smart_sample(video_path, mode=mode, proxy_size=proxy_size, return_indices=True)
+    return indices, time.perf_counter() - start
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("❌ Usage: python benchmark_sampler.py <video_path> [auto|sequential|seek]")
+        sys.exit(1)
+
+    video_path = sys.argv[1]
+    mode = sys.argv[2] if len(sys.argv) > 2 else "auto"
+
+    full_indices, full_time = run(video_path, None, mode)
+    proxy_indices, proxy_time = run(video_path, PROXY_SIZE, mode)
+
+    print('\n⏱️  Sampler Benchmark')
+    print('=' * 50)
+    print(f'Full resolution : {full_time:.2f}s  frames={full_indices}')
+    print(f'Proxy {PROXY_SIZE[0]}x{PROXY_SIZE[1]}  : {proxy_time:.2f}s  frames={proxy_indices}')
+    if proxy_time > 0:
+        print(f'Speedup         : {full_time / proxy_time:.2f}x')
+
+    if full_indices == proxy_indices:
+        print('✅ Identical frame selection')
+    else:
+        shared = len(set(full_indices) & set(proxy_indices))
+        print(f'⚠️  Selection differs: {shared}/{len(full_indices)} frames shared')
+
+
+if __name__ == "__main__":
+    main()
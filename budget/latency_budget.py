@@ -0,0 +1,70 @@
+import threading
+
+# Initial per-stage cost estimates in seconds (CPU, BLIP base); refined by
+# measurements from every analysed video
+DEFAULT_COSTS = {
+    "overhead": 3.0,            # Decode, stage 1, signals and policies
+    "blip_per_frame": 2.5,      # BLIP captioning (objects + scenes)
+    "detector_per_frame": 0.2,  # Pose, skin, blood and fire detectors
+    "audio": 6.0,               # Audio extraction and Whisper transcription
+}
+
+MIN_BUDGET_FRAMES = 1
+MAX_BUDGET_FRAMES = 15          # Same ceiling as the longest duration bucket in smart_sample
+COST_SMOOTHING = 0.3            # Weight of the newest measurement in the running estimate
+
+_costs = dict(DEFAULT_COSTS)
+_costs_lock = threading.Lock()
+
+
+def record_cost(name, seconds):
+    """Fold a measured stage cost into the running estimate"""
+    with _costs_lock:
+        _costs[name] = (1 - COST_SMOOTHING) * _costs[name] + COST_SMOOTHING * seconds
+
+
+def current_costs():
+    with _costs_lock:
+        return dict(_costs)
+
+
+class LatencyBudget:
+    """
+    Plans how much work fits in a latency budget and reports actual use.
+
+    The frame count is what remains after fixed overhead (and audio, when
+    it still leaves room for MIN_BUDGET_FRAMES) divided by the estimated
+    per-frame cost. Detectors run on `vision_workers` threads alongside
+    BLIP, so only the slower of the two is charged per frame.
+    """
+
+    def __init__(self, seconds, vision_workers=1, costs=None):
+        self.seconds = float(seconds)
+        self.costs = costs or current_costs()
+        self.vision_workers = max(1, vision_workers)
+
+    def per_frame_cost(self):
+        return max(self.costs["blip_per_frame"],
+                   self.costs["detector_per_frame"] / self.vision_workers)
+
+    def plan(self):
+        """Return (max_frames, run_audio) for this budget"""
+        available = self.seconds - self.costs["overhead"]
+        per_frame = self.per_frame_cost()
+
+        run_audio = available - self.costs["audio"] >= MIN_BUDGET_FRAMES * per_frame
+        if run_audio:
+            available -= self.costs["audio"]
+
+        max_frames = int(available // per_frame) if per_frame > 0 else MAX_BUDGET_FRAMES
+        max_frames = min(max(max_frames, MIN_BUDGET_FRAMES), MAX_BUDGET_FRAMES)
+        return max_frames, run_audio
+
+    def report(self, elapsed, max_frames, run_audio):
+        return {
+            "budget_seconds": round(self.seconds, 2),
+            "actual_seconds": round(elapsed, 2),
+            "within_budget": elapsed <= self.seconds,
+            "max_frames": max_frames,
+            "audio": run_audio,
+        }
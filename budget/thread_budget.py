@@ -0,0 +1,78 @@
+import os
+import threading
+from contextlib import contextmanager
+
+CPU_THREADS_ENV = "MODERATOR_CPU_THREADS"   # Cores this process may use; defaults to all of them
+INFERENCE_SHARE = 0.5                       # Share of the cores for torch (BLIP) and CTranslate2 (Whisper)
+
+
+def cpu_budget():
+    value = os.environ.get(CPU_THREADS_ENV)
+    return max(1, int(value)) if value else (os.cpu_count() or 1)
+
+
+class ThreadBudget:
+    """
+    Splits this process's core budget between model inference and frame pools.
+
+    BLIP (torch intra-op threads) and Whisper (CTranslate2 cpu_threads)
+    get INFERENCE_SHARE of the cores; BLIP batches from all videos go
+    through one BlipBatcher, so that share is not multiplied by the number
+    of videos. The remaining cores are divided between the per-frame
+    detector pools of the videos being analysed at the same time. OpenCV
+    runs single-threaded, since the pools already provide the parallelism.
+    When several processes share a box, give each its share of the cores
+    via MODERATOR_CPU_THREADS.
+    """
+
+    def __init__(self, cores=None):
+        self.cores = cores or cpu_budget()
+        self.inference_threads = max(1, int(self.cores * INFERENCE_SHARE))
+        self.detector_threads = max(1, self.cores - self.inference_threads)
+        self._active_videos = 0
+        self._lock = threading.Lock()
+
+    def apply_opencv(self):
+        import cv2
+        cv2.setNumThreads(1)
+
+    def apply_torch(self):
+        import torch
+        torch.set_num_threads(self.inference_threads)
+
+    def frame_workers(self, extra_videos=1):
+        """Frame pool size for a video started now, alongside the running ones"""
+        with self._lock:
+            return max(1, self.detector_threads // (self._active_videos + extra_videos))
+
+    @contextmanager
+    def video(self):
+        """Reserve a share of the detector threads for one analysis; yields its frame pool size"""
+        with self._lock:
+            self._active_videos += 1
+            workers = max(1, self.detector_threads // self._active_videos)
+        try:
+            yield workers
+        finally:
+            with self._lock:
+                self._active_videos -= 1
+
+    def report(self):
+        return {
+            "cores": self.cores,
+            "inference_threads": self.inference_threads,
+            "detector_threads": self.detector_threads,
+        }
+
+
+_thread_budget = None
+_thread_budget_lock = threading.Lock()
+
+
+def get_thread_budget():
+    global _thread_budget
+    with _thread_budget_lock:
+        if _thread_budget is None:
+            _thread_budget = ThreadBudget()
+            _thread_budget.apply_opencv()
+    return _thread_budget
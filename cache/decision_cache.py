@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "smart_moderator", "decisions.sqlite")
+CACHE_MAX_ENTRIES = 5000         # Least recently used decisions are evicted above this
+CACHE_SCHEMA = 1                 # Bump when the stored record layout changes
+
+FINGERPRINT_CHUNK = 64 * 1024    # Bytes hashed per sampled chunk
+FINGERPRINT_CHUNKS = 16          # Evenly spaced chunks hashed across the file
+
+# Model identifiers, source files, packages and config files whose changes invalidate cached decisions
+MODEL_IDS = ("Salesforce/blip-image-captioning-base", "whisper-tiny", "mediapipe-pose-1")
+VERSIONED_FILES = ("analyze_video.py",)    # Root pipeline: signal aggregation and cascade escalation
+VERSIONED_PACKAGES = (
+    "budget", "config", "policies", "policy_engine", "signals", "stage0_sampling", "stage1_fast_filter",
+    "stage2_vision", "stage3_temporal", "stage6_audio", "vision",
+)
+VERSIONED_EXTENSIONS = (".py", ".json")
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def file_fingerprint(path):
+    """
+    Fast content fingerprint: file size plus a hash of evenly spaced chunks.
+
+    Reads at most FINGERPRINT_CHUNKS * FINGERPRINT_CHUNK bytes regardless of
+    file size, so repeated uploads are recognised in milliseconds.
+    """
+    size = os.path.getsize(path)
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+
+    with open(path, "rb") as f:
+        if size <= FINGERPRINT_CHUNK * FINGERPRINT_CHUNKS:
+            digest.update(f.read())
+        else:
+            last = size - FINGERPRINT_CHUNK
+            for i in range(FINGERPRINT_CHUNKS):
+                f.seek(last * i // (FINGERPRINT_CHUNKS - 1))
+                digest.update(f.read(FINGERPRINT_CHUNK))
+
+    return f"{size}-{digest.hexdigest()}"
+
+
+def decision_key(fingerprint, **settings):
+    """
+    Cache key for a file analysed under `settings`.
+
+    Runs that sample fewer frames, skip audio or caption a different set of
+    frames can reach a different decision for the same file, so every
+    setting that changes the analysis is part of the key.
+    """
+    return fingerprint + "".join(f"|{name}={settings[name]}" for name in sorted(settings))
+
+
+def pipeline_version():
+    """Hash of the models and pipeline sources a cached decision depends on"""
+    digest = hashlib.blake2b(f"schema={CACHE_SCHEMA}".encode(), digest_size=16)
+    for model_id in MODEL_IDS:
+        digest.update(model_id.encode())
+
+    for name in VERSIONED_FILES:
+        digest.update(name.encode())
+        with open(os.path.join(_ROOT, name), "rb") as f:
+            digest.update(f.read())
+
+    for package in VERSIONED_PACKAGES:
+        package_dir = os.path.join(_ROOT, package)
+        if not os.path.isdir(package_dir):
+            continue
+        for name in sorted(os.listdir(package_dir)):
+            if name.endswith(VERSIONED_EXTENSIONS):
+                digest.update(f"{package}/{name}".encode())
+                with open(os.path.join(package_dir, name), "rb") as f:
+                    digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def _to_json(value):
+    # numpy scalars and similar expose item(); sets become lists
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+class DecisionCache:
+    """
+    SQLite-backed LRU cache of moderation results keyed by file fingerprint
+    and analysis settings (see decision_key()).
+
+    Each entry stores the decision, its explanation and the built signals
+    under the pipeline version; entries from another version are treated as
+    misses and replaced.
+    """
+
+    def __init__(self, path=CACHE_PATH, max_entries=CACHE_MAX_ENTRIES, version=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version or pipeline_version()
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS decisions (
+                fingerprint TEXT PRIMARY KEY,
+                version     TEXT NOT NULL,
+                decision    TEXT NOT NULL,
+                explanation TEXT NOT NULL,
+                signals     TEXT NOT NULL,
+                last_used   REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS decisions_lru ON decisions (last_used)")
+        self._conn.commit()
+
+    def get(self, fingerprint):
+        """Return (decision, explanation, signals) or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT decision, explanation, signals FROM decisions "
+                "WHERE fingerprint = ? AND version = ?",
+                (fingerprint, self.version)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE decisions SET last_used = ? WHERE fingerprint = ?",
+                (time.time(), fingerprint)
+            )
+            self._conn.commit()
+
+        decision, explanation, signals = row
+        return decision, json.loads(explanation), json.loads(signals)
+
+    def put(self, fingerprint, decision, explanation, signals):
+        record = (
+            fingerprint, self.version, decision,
+            json.dumps(explanation, default=_to_json),
+            json.dumps(signals, default=_to_json),
+            time.time()
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO decisions "
+                "(fingerprint, version, decision, explanation, signals, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                record
+            )
+            # LRU eviction down to the size cap
+            self._conn.execute(
+                "DELETE FROM decisions WHERE fingerprint IN ("
+                "SELECT fingerprint FROM decisions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_decision_cache = None
+_decision_cache_lock = threading.Lock()
+
+
+def get_decision_cache():
+    global _decision_cache
+    with _decision_cache_lock:
+        if _decision_cache is None:
+            _decision_cache = DecisionCache()
+    return _decision_cache
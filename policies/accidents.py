@@ -1,3 +1,6 @@
+from signals.vocabulary import signal_keywords
+
+
 def evaluate_accidents(signals):
     """
     Detect accidental events like falls or crashes.
@@ -8,17 +11,13 @@ def evaluate_accidents(signals):
     # ------------------------------------------------
     # BLIP CONTEXT ANALYSIS
     # ------------------------------------------------
-    scene_labels = signals.get("scene_labels", [])
-    descriptions = [label[0] if isinstance(label, tuple) else str(label) for label in scene_labels]
-    accident_desc = " ".join(descriptions).lower()
+    keywords = signal_keywords(signals)
     
     # Cooking context detection
-    cooking_words = ["cooking", "food", "tomato", "vegetable", "cutting", "preparing", "kitchen", "pepper", "cutting board", "wooden"]
-    is_cooking_context = any(word in accident_desc for word in cooking_words)
+    is_cooking_context = "cooking" in keywords
     
     # Staged content detection
-    staged_words = ["movie", "film", "scene", "trailer", "actor", "actress", "stunt", "performance"]
-    is_staged = any(word in accident_desc for word in staged_words)
+    is_staged = "staged" in keywords
 
     # ------------------------------------------------
     # HARD BLOCK — COOKING (ENHANCED)
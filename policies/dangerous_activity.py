@@ -1,3 +1,6 @@
+from signals.vocabulary import signal_keywords
+
+
 def evaluate_dangerous_activity(signals):
     """
     Dangerous but non-violent activities.
@@ -20,20 +23,14 @@ def evaluate_dangerous_activity(signals):
     # ------------------------------------------------
     # BLIP CONTEXT ANALYSIS
     # ------------------------------------------------
-    scene_labels = signals.get("scene_labels", [])
-    descriptions = [label[0] if isinstance(label, tuple) else str(label) for label in scene_labels]
-    activity_desc = " ".join(descriptions).lower()
+    keywords = signal_keywords(signals)
     
     # Cooking context detection
-    cooking_words = ["cooking", "food", "tomato", "vegetable", "cutting", "preparing", "kitchen", "pepper", "cutting board", "wooden"]
-    is_cooking_context = any(word in activity_desc for word in cooking_words)
+    is_cooking_context = "cooking" in keywords
     
     # Sports/recreational context detection
-    sports_words = ["sport", "game", "playing", "athlete", "competition", "training", "exercise", "workout"]
-    recreational_words = ["park", "playground", "recreation", "fun", "entertainment", "party"]
-    
-    is_sports = any(word in activity_desc for word in sports_words)
-    is_recreational = any(word in activity_desc for word in recreational_words)
+    is_sports = "sports_activity" in keywords
+    is_recreational = "leisure" in keywords
 
     if not human.get("human_present", False):
         return 0.0, []
@@ -52,12 +49,7 @@ def evaluate_dangerous_activity(signals):
 
     # ✅ SAFE OVERRIDE — NORMAL ACTIVITIES (NEW)
     # Check BLIP descriptions for normal, safe activities
-    normal_activity_words = [
-        "sitting", "bench", "holding", "box", "table", "chair", "standing",
-        "walking", "talking", "phone", "paper", "shoes", "gift", "present",
-        "driving", "car", "steering", "vehicle", "passenger", "seat"
-    ]
-    is_normal_activity = any(word in activity_desc for word in normal_activity_words)
+    is_normal_activity = "normal_activity" in keywords
     
     if is_normal_activity and not entity.get("weapon_present", False):
         return 0.0, ["Normal daily activity - safe"]
@@ -1,3 +1,6 @@
+from signals.vocabulary import signal_keywords
+
+
 def evaluate_fire_safety(signals):
     """
     Enhanced fire safety policy with BLIP context analysis.
@@ -16,15 +19,14 @@ def evaluate_fire_safety(signals):
     risk = 0.0
     reasons = []
     
-    human = signals.get("human", {})
     motion = signals.get("motion", {})
     visual = signals.get("visual_state", {})
     audio = signals.get("audio", {})
     scene = signals.get("scene", {})
     entity = signals.get("entity", {})
 
-    if not human.get("human_present", False):
-        return 0.0, []
+    # No human check: fires are a hazard with or without people in frame
+    # (wildfires, burning buildings), so human-free footage is still scored
 
     # ------------------------------------------------
     # COOKING CONTEXT OVERRIDE (CRITICAL FIX)
@@ -38,25 +40,18 @@ def evaluate_fire_safety(signals):
     # ------------------------------------------------
     # BLIP FIRE CONTEXT ANALYSIS
     # ------------------------------------------------
-    scene_labels = signals.get("scene_labels", [])
-    descriptions = [label[0] if isinstance(label, tuple) else str(label) for label in scene_labels]
-    fire_desc = " ".join(descriptions).lower()
+    keywords = signal_keywords(signals)
     
     # Fire context detection (ENHANCED)
-    dangerous_words = ["fire", "burning", "exploding", "out of control", "spreading", "wildfire", "emergency", "disaster", "dangerous", "unsafe", "evacuate", "rescue", "firefighter"]
-    emergency_words = ["emergency", "rescue", "firefighter", "alarm", "evacuation", "panic", "disaster"]
-    controlled_words = ["campfire", "bonfire", "fireplace", "controlled", "contained", "recreational", "safe"]
-    cooking_words = ["cooking", "kitchen", "stove", "oven", "grill", "preparing food"]
-
-    is_dangerous = any(word in fire_desc for word in dangerous_words)
-    is_emergency = any(word in fire_desc for word in emergency_words)
-    is_controlled = any(word in fire_desc for word in controlled_words)
-    is_cooking = any(word in fire_desc for word in cooking_words)
+    is_dangerous = "fire_danger" in keywords
+    is_emergency = "fire_emergency" in keywords
+    is_controlled = "fire_controlled" in keywords
+    is_cooking = "fire_cooking" in keywords
 
     # 🔥 FIRE DETECTION
     fire_detected = visual.get("fire_visible", False)
     fire_objects = entity.get("fire_present", False)
-    fire_mentioned = "fire" in fire_desc
+    fire_mentioned = "fire_mention" in keywords
     
     if not fire_detected and not fire_objects and not fire_mentioned:
         return 0.0, []  # No fire detected
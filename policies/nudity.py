@@ -1,3 +1,6 @@
+from signals.vocabulary import signal_keywords
+
+
 def evaluate_nudity(signals):
     """
     Enhanced nudity detection with BLIP context analysis.
@@ -21,22 +24,14 @@ def evaluate_nudity(signals):
     # ------------------------------------------------
     # BLIP NUDITY CONTEXT ANALYSIS
     # ------------------------------------------------
-    scene_labels = signals.get("scene_labels", [])
-    descriptions = [label[0] if isinstance(label, tuple) else str(label) for label in scene_labels]
-    nudity_desc = " ".join(descriptions).lower()
+    keywords = signal_keywords(signals)
     
     # Context detection
-    sexualized_words = ["sexual", "erotic", "intimate", "seductive", "provocative", "explicit", "nude", "naked"]
-    artistic_words = ["art", "painting", "sculpture", "artistic", "museum", "gallery", "classical"]
-    medical_words = ["medical", "hospital", "doctor", "examination", "procedure", "surgery"]
-    recreational_words = ["beach", "pool", "swimming", "bathing", "showering", "changing", "bathing suit"]
-    private_words = ["bedroom", "private", "home", "alone", "intimate"]
-
-    is_sexualized = any(word in nudity_desc for word in sexualized_words)
-    is_artistic = any(word in nudity_desc for word in artistic_words)
-    is_medical = any(word in nudity_desc for word in medical_words)
-    is_recreational = any(word in nudity_desc for word in recreational_words)
-    is_private = any(word in nudity_desc for word in private_words)
+    is_sexualized = "sexualized" in keywords
+    is_artistic = "artistic" in keywords
+    is_medical = "medical" in keywords
+    is_recreational = "recreational" in keywords
+    is_private = "private" in keywords
 
     skin = visual.get("skin_exposure_ratio", 0.0)
 
@@ -59,8 +54,7 @@ def evaluate_nudity(signals):
     # COOKING CONTEXT OVERRIDE (CRITICAL FIX)
     # ------------------------------------------------
     # If BLIP detects cooking context, immediately return SAFE - this prevents false positives
-    cooking_words = ["cooking", "food", "tomato", "vegetable", "cutting", "preparing", "kitchen", "pepper", "cutting board", "wooden"]
-    is_cooking_context = any(word in nudity_desc for word in cooking_words)
+    is_cooking_context = "cooking" in keywords
     
     if is_cooking_context:
         return 0.0, ["Cooking/food preparation context - safe"]
@@ -69,8 +63,7 @@ def evaluate_nudity(signals):
     # FIRE CONTEXT OVERRIDE (CRITICAL FIX)
     # ------------------------------------------------
     # If BLIP detects fire context, immediately return SAFE - prevents false positives
-    fire_words = ["fire", "burning", "flame", "campfire", "bonfire"]
-    is_fire_context = any(word in nudity_desc for word in fire_words)
+    is_fire_context = "fire_context" in keywords
     
     if is_fire_context:
         return 0.0, ["Fire context - safe"]
@@ -79,8 +72,7 @@ def evaluate_nudity(signals):
     # MEDICAL CONTEXT OVERRIDE (NEW)
     # ------------------------------------------------
     # If BLIP detects medical context, immediately return SAFE
-    medical_words = ["medical", "hospital", "doctor", "nurse", "surgery", "examination", "procedure", "clinic", "patient", "treatment", "emergency room"]
-    is_medical_context = any(word in nudity_desc for word in medical_words)
+    is_medical_context = "medical_context" in keywords
     
     if is_medical_context:
         return 0.0, ["Medical context - safe"]
@@ -89,8 +81,7 @@ def evaluate_nudity(signals):
     # ARTISTIC CONTEXT OVERRIDE (NEW)
     # ------------------------------------------------
     # If BLIP detects artistic context, immediately return SAFE
-    artistic_words = ["art", "artist", "painting", "sculpture", "museum", "gallery", "classical", "studio", "exhibition", "drawing", "portrait", "nude art"]
-    is_artistic_context = any(word in nudity_desc for word in artistic_words)
+    is_artistic_context = "artistic_context" in keywords
     
     if is_artistic_context:
         return 0.0, ["Artistic context - safe"]
@@ -111,7 +102,7 @@ def evaluate_nudity(signals):
     # ENHANCED CONTEXT-BASED ASSESSMENT
     # ------------------------------------------------
     if is_sexualized:
-        if "explicit" in nudity_desc or "naked" in nudity_desc:
+        if "explicit" in keywords:
             risk = max(risk, 0.95)
             reasons.append("Explicit sexual content detected")
         else:
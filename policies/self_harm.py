@@ -1,3 +1,6 @@
+from signals.vocabulary import signal_keywords
+
+
 def evaluate_self_harm(signals):
     """
     Detect self-harm behavior.
@@ -19,22 +22,15 @@ def evaluate_self_harm(signals):
     # ------------------------------------------------
     # BLIP CONTEXT ANALYSIS
     # ------------------------------------------------
-    scene_labels = signals.get("scene_labels", [])
-    descriptions = [label[0] if isinstance(label, tuple) else str(label) for label in scene_labels]
-    self_harm_desc = " ".join(descriptions).lower()
+    keywords = signal_keywords(signals)
     
     # Cooking context detection
-    cooking_words = ["cooking", "food", "tomato", "vegetable", "cutting", "preparing", "kitchen", "pepper", "cutting board", "wooden"]
-    is_cooking_context = any(word in self_harm_desc for word in cooking_words)
+    is_cooking_context = "cooking" in keywords
     
     # Artistic/medical context detection
-    artistic_words = ["art", "painting", "sculpture", "artistic", "museum", "gallery", "classical"]
-    medical_words = ["medical", "hospital", "doctor", "examination", "procedure", "surgery"]
-    recreational_words = ["beach", "pool", "swimming", "bathing", "showering", "changing"]
-    
-    is_artistic = any(word in self_harm_desc for word in artistic_words)
-    is_medical = any(word in self_harm_desc for word in medical_words)
-    is_recreational = any(word in self_harm_desc for word in recreational_words)
+    is_artistic = "artistic" in keywords
+    is_medical = "medical" in keywords
+    is_recreational = "recreational" in keywords
 
     # ----------------------------------------
     # HARD BLOCKS (IMPORTANT - ENHANCED)
@@ -1,3 +1,6 @@
+from signals.vocabulary import signal_keywords
+
+
 def evaluate_violence(signals):
     """
     Intent-aware violence detection with BLIP context analysis.
@@ -28,16 +31,13 @@ def evaluate_violence(signals):
     # ------------------------------------------------
     # BLIP CONTEXT ANALYSIS
     # ------------------------------------------------
-    scene_labels = signals.get("scene_labels", [])
-    descriptions = [label[0] if isinstance(label, tuple) else str(label) for label in scene_labels]
+    keywords = signal_keywords(signals)
     
     # Detect staged/movie content
-    staged_indicators = ["movie", "film", "scene", "trailer", "actor", "actress", "stunt", "performance"]
-    is_staged = any(indicator in " ".join(descriptions).lower() for indicator in staged_indicators)
+    is_staged = "staged" in keywords
     
     # Detect actual violence context
-    violence_words = ["fight", "fighting", "punch", "hit", "attack", "assault", "beat", "strike", "violent"]
-    has_violence_desc = any(word in " ".join(descriptions).lower() for word in violence_words)
+    has_violence_desc = "violent_action" in keywords
 
     # ------------------------------------------------
     # HARD BLOCK — NO HUMAN
@@ -85,9 +85,7 @@ def evaluate_violence(signals):
     # COOKING CONTEXT OVERRIDE (CRITICAL FIX)
     # ------------------------------------------------
     # If BLIP detects cooking context, immediately return SAFE - this prevents false positives
-    cooking_words = ["cooking", "food", "tomato", "vegetable", "cutting", "preparing", "kitchen", "pepper", "cutting board", "wooden"]
-    violence_desc = " ".join(descriptions).lower()
-    is_cooking_context = any(word in violence_desc for word in cooking_words)
+    is_cooking_context = "cooking" in keywords
     
     if is_cooking_context:
         return 0.0, ["Cooking/food preparation context - safe"]
@@ -96,8 +94,7 @@ def evaluate_violence(signals):
     # SPORTS CONTEXT OVERRIDE (NEW)
     # ------------------------------------------------
     # If BLIP detects sports context, immediately return SAFE
-    sports_words = ["sport", "game", "playing", "athlete", "competition", "training", "exercise", "workout", "soccer", "basketball", "football", "tennis", "running", "swimming", "gym"]
-    is_sports_context = any(word in violence_desc for word in sports_words)
+    is_sports_context = "sports" in keywords
     
     if is_sports_context:
         return 0.0, ["Sports activity - safe"]
@@ -108,12 +105,8 @@ def evaluate_violence(signals):
     if visual.get("blood_visible", False):
         
         # Analyze blood context from descriptions
-        blood_desc = violence_desc
-        cooking_words = ["cooking", "food", "tomato", "sauce", "kitchen", "cutting", "preparing"]
-        injury_words = ["injury", "wound", "bleeding", "hurt", "accident", "cut", "stab"]
-        
-        is_cooking_context = any(word in blood_desc for word in cooking_words)
-        is_injury_context = any(word in blood_desc for word in injury_words)
+        is_cooking_context = "blood_cooking" in keywords
+        is_injury_context = "injury" in keywords
 
         # 🛑 Blood + food context → NOT violence
         if (
@@ -0,0 +1,16 @@
+import os
+import sys
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv")
+
+
+def clip_paths(clip_dir):
+    """Sorted paths of the video clips in clip_dir; exits with a message when there are none"""
+    clips = sorted(
+        os.path.join(clip_dir, name) for name in os.listdir(clip_dir)
+        if name.lower().endswith(VIDEO_EXTENSIONS)
+    )
+    if not clips:
+        print(f"❌ No video clips found in {clip_dir}")
+        sys.exit(1)
+    return clips
@@ -0,0 +1,96 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Dependencies that are imported lazily, in the order a full analysis pays for them
+HEAVY_IMPORTS = (
+    ("PyTorch", "torch"),
+    ("Transformers", "transformers"),
+    ("MediaPipe", "mediapipe"),
+    ("faster-whisper", "faster_whisper"),
+)
+HEAVY_MODULES = tuple(module for _, module in HEAVY_IMPORTS) + ("whisper", "cv2")
+
+# Modules that must import without any heavy dependency, and their time limit
+LIGHT_MODULES = ("policy_engine.evaluator", "policy_engine.aggregator", "signals.signals_builder")
+LIGHT_IMPORT_LIMIT = 0.05   # Seconds
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def light_import_check():
+    """
+    Import LIGHT_MODULES in a fresh interpreter.
+
+    Returns (seconds, heavy modules pulled in); the policy engine is cheap
+    only as long as the second item stays empty and seconds stays below
+    LIGHT_IMPORT_LIMIT.
+    """
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"for name in {LIGHT_MODULES!r}: __import__(name)\n"
+        "seconds = time.perf_counter() - start\n"
+        f"print(json.dumps([seconds, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=_ROOT,
+                            capture_output=True, text=True, check=True)
+    seconds, heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    return seconds, heavy
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    try:
+        fn()
+        return time.perf_counter() - start, None
+    except Exception as e:
+        return time.perf_counter() - start, str(e)
+
+
+def profile_startup(import_seconds=None):
+    """
+    Time every lazily imported dependency and model load in this process.
+
+    Each step is measured incrementally, i.e. what it adds on top of the
+    steps before it, which is what the first analysis in a process pays.
+    import_seconds is the caller's own module-level import time, if known.
+    Returns a list of (step, seconds, error) tuples.
+    """
+    from stage2_vision.blip_scene import get_blip_model
+    from stage6_audio.audio_analyzer import get_whisper_model
+    from vision.pose_detector import PoseAnalyzer
+
+    steps = []
+    if import_seconds is not None:
+        steps.append(("import analyze_video", import_seconds, None))
+
+    for label, module in HEAVY_IMPORTS:
+        seconds, error = _timed(lambda: importlib.import_module(module))
+        steps.append((f"import {label}", seconds, error))
+
+    for label, load in (("load BLIP", get_blip_model),
+                        ("load Whisper", get_whisper_model),
+                        ("load MediaPipe pose", PoseAnalyzer)):
+        seconds, error = _timed(load)
+        steps.append((label, seconds, error))
+
+    return steps
+
+
+def print_startup_profile(steps):
+    seconds, heavy = light_import_check()
+
+    print('\n⏱️  Startup Profile')
+    print('=' * 50)
+    for step, step_seconds, error in steps:
+        status = f"  ⚠️  {error}" if error else ""
+        print(f'{step.ljust(24)}: {step_seconds:7.3f}s{status}')
+    print(f'{"Total".ljust(24)}: {sum(s for _, s, _ in steps):7.3f}s')
+
+    within = seconds <= LIGHT_IMPORT_LIMIT and not heavy
+    print(f'\n{"✅" if within else "❌"} Policy engine import: {seconds * 1000:.1f} ms'
+          + (f" (pulls in {', '.join(heavy)})" if heavy else ""))
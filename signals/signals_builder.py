@@ -1,3 +1,6 @@
+from signals.vocabulary import label_text, match_keywords
+
+
 def build_signals(
     motion_score,
     risky_objects,
@@ -14,16 +17,15 @@ def build_signals(
     # ---------------- FOOD CONTEXT ----------------
     crash_detected = any(obj in ["vehicle_crash", "accident", "crash"] for obj in risky_objects)
     
+    # Scene descriptions are matched against the shared vocabulary once;
+    # policies reuse the hits through signals["keywords"]
+    keywords = match_keywords(label_text(scene_labels))
+
     # Much stricter food context detection - require explicit food indicators
-    food_keywords = ["kitchen", "cooking", "food", "vegetable", "cutting", "chef", "recipe", "meal", "dinner", "lunch", "breakfast", "restaurant", "tomato", "pepper"]
     cooking_objects = ["knife", "cutting_board", "pot", "pan", "stove", "oven", "grill", "mixing_bowl", "spatula", "fork", "spoon", "food", "vegetable"]
     
     # Require scene description OR objects to indicate cooking (more lenient)
-    scene_has_food = any(
-        kw in label.lower()
-        for label, _ in scene_labels
-        for kw in food_keywords
-    )
+    scene_has_food = "food_context" in keywords
     
     objects_have_food = any(obj in safe_objects for obj in cooking_objects)
     
@@ -40,7 +42,7 @@ def build_signals(
 
     return {
         "entity": {
-            "knife_present": "knife" in risky_objects or any("cutting" in label.lower() for label, _ in scene_labels),
+            "knife_present": "knife" in risky_objects or "cutting" in keywords,
             "weapon_present": any(o in ["gun", "pistol", "rifle"] for o in risky_objects),
             "food_present": food_context,
             "vehicle_present": any(o in ["car", "bus", "truck", "vehicle_crash", "accident"] for o in risky_objects),
@@ -85,5 +87,6 @@ def build_signals(
             "possible_accident": motion_score > 50 and not temporal_state["impact_detected"]  # Increased from 20
         },
         
-        "scene_labels": scene_labels  # Add scene_labels for policy context analysis
+        "scene_labels": scene_labels,  # Add scene_labels for policy context analysis
+        "keywords": keywords
     }
@@ -0,0 +1,169 @@
+import re
+
+# Keyword categories shared by stage 2, the signals builder, the policies and
+# audio analysis. Matching is per whole word; regular plurals (-s, -es, -ies)
+# are folded automatically, other inflections are listed as "|" variants of
+# a canonical term, and multi-word phrases match across whitespace.
+VOCABULARY = {
+    # ---------------- BLIP OBJECTS (stage 2) ----------------
+    "weapon": ("gun|gunfire|gunman|shotgun", "weapon", "knife|knives", "rifle", "pistol"),
+    "firearm": ("gun|gunfire|gunman|shotgun", "rifle", "pistol"),
+    "knife": ("knife|knives",),
+    "knife_food": ("cooking", "food"),
+    "vehicle": ("car", "vehicle", "truck", "automobile"),
+    "collision": ("crash|crashed|crashing", "accident", "collision", "wreck|wrecked|wreckage",
+                  "smash|smashed|smashing", "hit|hitting"),
+    "crash": ("crash|crashed|crashing", "accident", "collision", "wreck|wrecked|wreckage"),
+    "fire_object": ("fire|campfire|bonfire|wildfire|fireplace|firefighter", "flame|flaming",
+                    "explosion", "burning"),
+    "violence_object": ("fight|fighting|fighter", "attack|attacked|attacking", "violence",
+                        "assault|assaulted|assaulting", "punch|punched|punching"),
+    "food_object": ("tomato", "vegetable", "food", "cooking", "kitchen"),
+    "cooking_object": ("cooking", "kitchen"),
+
+    # ---------------- BLIP SCENES (stage 2) ----------------
+    "kitchen_scene": ("kitchen", "cooking", "food", "tomato", "vegetable"),
+    "outdoor_scene": ("woods|wood", "outdoor|outdoors", "outside", "nature", "tree", "mountain", "field"),
+    "indoor_scene": ("kitchen", "room|bedroom|bathroom|classroom", "inside", "indoor|indoors", "home",
+                     "building"),
+    "scene_risk": ("gun|gunfire|gunman|shotgun", "weapon", "knife|knives", "blood|bloody",
+                   "attack|attacked|attacking", "fight|fighting|fighter", "violent",
+                   "threatening", "harm", "screaming", "fear", "abuse|abused|abusive",
+                   "accident", "crash|crashed|crashing", "fire|campfire|bonfire|wildfire|fireplace"),
+    "scene_safety": ("cooking", "food", "kitchen", "vegetable", "tomato", "meal", "preparing",
+                     "household", "daily"),
+
+    # ---------------- SIGNALS ----------------
+    "food_context": ("kitchen", "cooking", "food", "vegetable", "cutting", "chef", "recipe", "meal",
+                     "dinner", "lunch", "breakfast", "restaurant", "tomato", "pepper"),
+    "cutting": ("cutting",),
+
+    # ---------------- POLICIES ----------------
+    "cooking": ("cooking", "food", "tomato", "vegetable", "cutting", "preparing", "kitchen", "pepper",
+                "cutting board", "wooden"),
+    "staged": ("movie", "film|filming", "scene", "trailer", "actor", "actress", "stunt", "performance"),
+    "violent_action": ("fight|fighting|fighter", "punch|punched|punching", "hit|hitting",
+                       "attack|attacked|attacking", "assault|assaulted|assaulting",
+                       "beat|beating", "strike|striking", "violent"),
+    "sports": ("sport|sporting", "game", "playing", "athlete", "competition", "training",
+               "exercise|exercising", "workout", "soccer", "basketball", "football", "tennis",
+               "running", "swimming", "gym"),
+    "blood_cooking": ("cooking", "food", "tomato", "sauce", "kitchen", "cutting", "preparing"),
+    "injury": ("injury|injured", "wound|wounded", "bleeding", "hurt", "accident", "cut",
+               "stab|stabbed|stabbing"),
+    "sexualized": ("sexual", "erotic", "intimate", "seductive", "provocative", "explicit", "nude",
+                   "naked"),
+    "explicit": ("explicit", "naked"),
+    "artistic": ("art", "painting", "sculpture", "artistic", "museum", "gallery", "classical"),
+    "medical": ("medical", "hospital", "doctor", "examination", "procedure", "surgery"),
+    "recreational": ("beach", "pool", "swimming", "bathing", "showering", "changing", "bathing suit"),
+    "private": ("bedroom", "private", "home", "alone", "intimate"),
+    "fire_context": ("fire|campfire|bonfire", "burning", "flame|flaming"),
+    "medical_context": ("medical", "hospital", "doctor", "nurse", "surgery", "examination", "procedure",
+                        "clinic", "patient", "treatment", "emergency room"),
+    "artistic_context": ("art", "artist", "painting", "sculpture", "museum", "gallery", "classical",
+                         "studio", "exhibition", "drawing", "portrait", "nude art", "artistic"),
+    "sports_activity": ("sport|sporting", "game", "playing", "athlete", "competition", "training",
+                        "exercise|exercising", "workout"),
+    "leisure": ("park", "playground", "recreation", "fun", "entertainment", "party"),
+    "normal_activity": ("sitting", "bench", "holding", "box", "table", "chair", "standing", "walking",
+                        "talking", "phone", "paper", "shoe", "gift", "present", "driving", "car",
+                        "steering", "vehicle", "passenger", "seat|seated"),
+    "fire_mention": ("fire|campfire|bonfire|wildfire|fireplace|firefighter",),
+    "fire_danger": ("fire|wildfire", "burning", "exploding", "out of control", "spreading", "emergency",
+                    "disaster", "dangerous", "unsafe", "evacuate", "rescue", "firefighter"),
+    "fire_emergency": ("emergency", "rescue", "firefighter", "alarm", "evacuation", "panic", "disaster"),
+    "fire_controlled": ("campfire", "bonfire", "fireplace", "controlled", "contained", "recreational",
+                        "safe"),
+    "fire_cooking": ("cooking", "kitchen", "stove", "oven", "grill", "preparing food"),
+
+    # ---------------- AUDIO ----------------
+    "audio_risk": ("kill|killed|killing|killer", "beat|beating", "hit|hitting", "die|died|dying",
+                   "blood|bloody", "knife|knives", "gun|gunfire|gunman|shotgun",
+                   "threat|threaten|threatening", "abuse|abused|abusive", "fight|fighting|fighter",
+                   "stab|stabbed|stabbing", "murder|murdered|murderer"),
+}
+
+# Underscores split words, so scene label prefixes ("safe_scene: ...") keep
+# contributing "safe" and "scene" as they did with substring matching
+_TOKEN = re.compile(r"[a-z0-9]+")
+_ES_PLURALS = ("ches", "shes", "sses", "xes", "zes", "oes")
+
+
+def _forms(token):
+    """The token and every candidate singular, for regular English plurals"""
+    forms = [token]
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        forms.append(token[:-1])                # shoes -> shoe, movies -> movie
+        if len(token) > 4 and token.endswith(_ES_PLURALS):
+            forms.append(token[:-2])            # boxes -> box, tomatoes -> tomato
+        if len(token) > 4 and token.endswith("ies"):
+            forms.append(token[:-3] + "y")      # injuries -> injury
+    return forms
+
+
+class KeywordHits(dict):
+    """
+    Category -> frozenset of canonical terms found in a text.
+
+    `category in hits` is an O(1) membership test; being a plain dict of
+    sets it serializes with the rest of the signals.
+    """
+
+    def count(self, category):
+        """Number of distinct terms of `category` found"""
+        return len(self.get(category, ()))
+
+
+class Vocabulary:
+    """
+    Multi-pattern whole-word matcher over a set of keyword categories.
+
+    All terms of all categories are compiled into one index keyed by their
+    first word, so a text is tokenized once and each token costs a dict
+    lookup per form, regardless of how many categories or terms exist.
+    """
+
+    def __init__(self, categories):
+        self._index = {}  # first word -> [(remaining words, category, canonical term)]
+        for category, terms in categories.items():
+            for term in terms:
+                variants = term.split("|")
+                for variant in variants:
+                    words = tuple(variant.split())
+                    self._index.setdefault(words[0], []).append((words[1:], category, variants[0]))
+
+    def match(self, text):
+        """Tokenize `text` once and return its KeywordHits"""
+        forms = [_forms(token) for token in _TOKEN.findall(text.lower())]
+        found = {}
+        for i, token_forms in enumerate(forms):
+            for form in token_forms:
+                for rest, category, canonical in self._index.get(form, ()):
+                    if rest and not (
+                        i + len(rest) < len(forms)
+                        and all(word in forms[i + 1 + k] for k, word in enumerate(rest))
+                    ):
+                        continue
+                    found.setdefault(category, set()).add(canonical)
+        return KeywordHits((category, frozenset(terms)) for category, terms in found.items())
+
+
+VOCABULARY_INDEX = Vocabulary(VOCABULARY)
+
+
+def match_keywords(text):
+    return VOCABULARY_INDEX.match(text)
+
+
+def label_text(scene_labels):
+    """Joined text of (label, score) scene results or plain label strings"""
+    return " ".join(label[0] if isinstance(label, (tuple, list)) else str(label) for label in scene_labels)
+
+
+def signal_keywords(signals):
+    """KeywordHits of the scene descriptions, matched once by build_signals"""
+    keywords = signals.get("keywords")
+    if isinstance(keywords, KeywordHits):
+        return keywords
+    return match_keywords(label_text(signals.get("scene_labels", [])))
@@ -0,0 +1,113 @@
+import os
+import re
+from collections import deque
+import shutil
+import subprocess
+import threading
+import queue
+
+import numpy as np
+
+from stage6_audio.audio_utils import FFMPEG_PATH
+
+FFMPEG_THREADS = 0      # Decoder/filter threads handed to ffmpeg; 0 lets it use every core
+DECODE_WIDTH = 640      # Frames wider than this are downscaled inside ffmpeg
+PTS_TIMEOUT = 5         # Seconds to wait for a frame's showinfo line before giving up on its timestamp
+
+_PTS_TIME = re.compile(rb"pts_time:\s*(-?[\d.]+)")
+
+
+def find_ffmpeg():
+    """Return a usable ffmpeg executable, or None when ffmpeg is not installed"""
+    if os.path.exists(FFMPEG_PATH):
+        return FFMPEG_PATH
+    return shutil.which("ffmpeg")
+
+
+def output_size(width, height, max_width=DECODE_WIDTH):
+    """Size ffmpeg scales frames to, keeping aspect ratio and an even height"""
+    if width <= max_width:
+        return width, height
+    out_height = max(2, int(round(height * max_width / width / 2)) * 2)
+    return max_width, out_height
+
+
+def _read_pts(stderr, pts_queue, messages):
+    for line in stderr:
+        if b"showinfo" in line:
+            match = _PTS_TIME.search(line)
+            if match:
+                pts_queue.put(float(match.group(1)))
+        else:
+            messages.append(line)
+
+
+def _read_exact(stream, buf):
+    view = memoryview(buf)
+    filled = 0
+    while filled < len(buf):
+        n = stream.readinto(view[filled:])
+        if not n:
+            return False
+        filled += n
+    return True
+
+
+def ffmpeg_frames(video_path, size, every=1, scene_thresh=None,
+                  threads=FFMPEG_THREADS, ffmpeg_path=None):
+    """
+    Decode a video through an ffmpeg rawvideo pipe.
+
+    Frame selection (every `every`-th frame, plus any frame whose ffmpeg
+    scene score exceeds `scene_thresh` in 0-1) and scaling to `size` run
+    inside ffmpeg, so Python only receives candidate frames. Yields
+    (pts_time, frame) pairs; pts_time is None if ffmpeg did not report it.
+    Raises RuntimeError with ffmpeg's last message if it exits with an
+    error (e.g. builds older than 5.1, which lack -fps_mode).
+    """
+    ffmpeg_path = ffmpeg_path or find_ffmpeg()
+    if ffmpeg_path is None:
+        raise FileNotFoundError("ffmpeg executable not found")
+
+    width, height = size
+    terms = [f"not(mod(n,{max(1, int(every))}))"]
+    if scene_thresh is not None:
+        terms.append(f"gt(scene,{scene_thresh:.4f})")
+    vf = f"select='{'+'.join(terms)}',scale={width}:{height},showinfo"
+
+    cmd = [
+        ffmpeg_path, "-hide_banner", "-nostats", "-loglevel", "info",
+        "-threads", str(threads), "-filter_threads", str(threads),
+        "-i", video_path, "-an", "-vf", vf, "-fps_mode", "passthrough",
+        "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"
+    ]
+
+    frame_bytes = width * height * 3
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, bufsize=frame_bytes)
+    pts_queue = queue.Queue()
+    messages = deque(maxlen=5)  # Last non-showinfo stderr lines, for error reports
+    reader = threading.Thread(target=_read_pts, args=(proc.stderr, pts_queue, messages), daemon=True)
+    reader.start()
+
+    try:
+        while True:
+            buf = bytearray(frame_bytes)
+            if not _read_exact(proc.stdout, buf):
+                break
+            frame = np.frombuffer(buf, dtype=np.uint8).reshape(height, width, 3)
+            try:
+                pts_time = pts_queue.get(timeout=PTS_TIMEOUT)
+            except queue.Empty:
+                pts_time = None
+            yield pts_time, frame
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        reader.join(timeout=1)
+
+    if proc.returncode:
+        reason = "; ".join(line.decode(errors="replace").strip() for line in messages) or "no output"
+        raise RuntimeError(f"ffmpeg exited with status {proc.returncode}: {reason}")
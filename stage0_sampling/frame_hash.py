@@ -0,0 +1,41 @@
+import cv2
+import numpy as np
+
+HASH_BITS = 64
+
+
+def dhash(gray):
+    """64-bit difference hash of a grayscale image (9x8 gradient signs)"""
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class HashIndex:
+    """
+    Hamming-distance index over the hashes of already selected frames.
+
+    A candidate is a duplicate when the share of matching bits with any
+    indexed hash exceeds `threshold`, so every selected frame is checked,
+    not just the most recent ones.
+    """
+
+    def __init__(self, threshold=0.95):
+        self.threshold = threshold
+        self.hashes = []
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def add(self, frame_hash):
+        self.hashes.append(frame_hash)
+
+    def is_duplicate(self, frame_hash):
+        for known in self.hashes:
+            if 1 - hamming(frame_hash, known) / HASH_BITS > self.threshold:
+                return True
+        return False
@@ -0,0 +1,71 @@
+import cv2
+
+from stage0_sampling.frame_hash import dhash
+
+SMALL_SIZE = (320, 240)   # (width, height) shared by the colour-ratio detectors
+
+
+class FramePacket:
+    """
+    A sampled frame plus lazily computed colour planes.
+
+    Stage 0 wraps every selected frame in a packet so later stages read the
+    same gray / HSV / YCrCb / RGB / downscaled views instead of converting
+    the frame again. Views are built on first access and memoized; two
+    threads racing on the same view both compute an identical array, which
+    is harmless.
+    """
+
+    def __init__(self, image, index=None, timestamp=None):
+        self.image = image          # Original BGR frame
+        self.index = index          # Source frame index in the video
+        self.timestamp = timestamp  # Seconds from the start of the video
+        self.caption = None         # BLIP description, filled once by stage 2
+        self._views = {}
+
+    def _view(self, name, build):
+        view = self._views.get(name)
+        if view is None:
+            view = build()
+            self._views[name] = view
+        return view
+
+    @property
+    def shape(self):
+        return self.image.shape
+
+    @property
+    def gray(self):
+        return self._view("gray", lambda: cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY))
+
+    @property
+    def hsv(self):
+        return self._view("hsv", lambda: cv2.cvtColor(self.image, cv2.COLOR_BGR2HSV))
+
+    @property
+    def rgb(self):
+        return self._view("rgb", lambda: cv2.cvtColor(self.image, cv2.COLOR_BGR2RGB))
+
+    @property
+    def small(self):
+        return self._view("small", lambda: cv2.resize(self.image, SMALL_SIZE))
+
+    @property
+    def small_hsv(self):
+        return self._view("small_hsv", lambda: cv2.cvtColor(self.small, cv2.COLOR_BGR2HSV))
+
+    @property
+    def small_ycrcb(self):
+        return self._view("small_ycrcb", lambda: cv2.cvtColor(self.small, cv2.COLOR_BGR2YCrCb))
+
+    @property
+    def dhash(self):
+        """64-bit difference hash used for near-duplicate rejection"""
+        return self._view("dhash", lambda: dhash(self.gray))
+
+
+def as_packet(frame):
+    """Wrap a raw BGR array in a FramePacket; packets and None pass through"""
+    if frame is None or isinstance(frame, FramePacket):
+        return frame
+    return FramePacket(frame)
@@ -0,0 +1,70 @@
+from array import array
+from bisect import bisect_left
+
+import numpy as np
+
+
+class MotionTimeline:
+    """
+    Motion and scene scores computed by stage 0, kept in compact typed arrays.
+
+    Every frame the sampler scores is recorded with its motion and scene
+    value, and every kept frame index is marked as selected together with
+    its motion relative to the previous kept frame, so stage 1 and the
+    temporal brain can reuse these signals instead of diffing frames again.
+    Frame indices are recorded in ascending order.
+    """
+
+    def __init__(self):
+        self._indices = array("q")
+        self._motion = array("f")
+        self._scene = array("f")
+        self._selected = array("q")
+        self._key_motion = array("f")
+
+    def __len__(self):
+        return len(self._indices)
+
+    def record(self, frame_idx, motion_score, scene_score):
+        self._indices.append(frame_idx)
+        self._motion.append(motion_score)
+        self._scene.append(scene_score)
+
+    def select(self, frame_idx, key_motion=None):
+        """Mark frame_idx as kept; key_motion is its motion against the previous kept frame"""
+        self._selected.append(frame_idx)
+        if key_motion is not None:
+            self._key_motion.append(key_motion)
+
+    def extend(self, other):
+        """Append another timeline's scored frames (e.g. a later segment)"""
+        self._indices.extend(other._indices)
+        self._motion.extend(other._motion)
+        self._scene.extend(other._scene)
+
+    def motion_at(self, frame_idx):
+        """Motion score recorded for frame_idx, or 0.0 if it was not scored"""
+        i = bisect_left(self._indices, frame_idx)
+        if i < len(self._indices) and self._indices[i] == frame_idx:
+            return float(self._motion[i])
+        return 0.0
+
+    @property
+    def indices(self):
+        return np.frombuffer(self._indices, dtype=np.int64).copy()
+
+    @property
+    def motion(self):
+        return np.frombuffer(self._motion, dtype=np.float32).copy()
+
+    @property
+    def scene(self):
+        return np.frombuffer(self._scene, dtype=np.float32).copy()
+
+    @property
+    def selected(self):
+        return np.frombuffer(self._selected, dtype=np.int64).copy()
+
+    @property
+    def key_motion(self):
+        return np.frombuffer(self._key_motion, dtype=np.float32).copy()
@@ -1,94 +1,120 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import cv2
 import numpy as np
-from collections import deque
 
-def smart_sample(
-    video_path,
-    motion_thresh=15,   # Lower threshold for better sensitivity
-    scene_thresh=25,    # Lower threshold for scene change detection
-    min_gap=10,         # Larger gap to avoid similar frames
-    max_frames=8,       # Fewer frames to avoid redundancy
-    similarity_thresh=0.95  # Similarity threshold for frame deduplication
-):
-    cap = cv2.VideoCapture(video_path)
-    
-    # Get video duration to adjust sampling strategy
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    duration = total_frames / fps if fps > 0 else 0
-    
-    # More conservative frame allocation to avoid redundancy
-    if duration > 0:
-        if duration <= 10:      # Very short videos
-            target_frames = min(3, total_frames)
-        elif duration <= 30:    # Short videos  
-            target_frames = min(5, total_frames)
-        elif duration <= 60:    # 1 minute videos
-            target_frames = min(8, total_frames)
-        elif duration <= 180:   # 3 minute videos
-            target_frames = min(12, total_frames)
-        else:                   # Long videos
-            target_frames = min(15, total_frames)
-        
-        max_frames = max(target_frames, max_frames)
-    
-    selected_frames = []
+from stage0_sampling.frame_hash import HashIndex
+from stage0_sampling.frame_packet import FramePacket
+from stage0_sampling.motion_timeline import MotionTimeline
+from stage0_sampling.ffmpeg_decoder import FFMPEG_THREADS, ffmpeg_frames, find_ffmpeg, output_size
+
+SAMPLING_MODES = ("auto", "sequential", "seek", "segmented")
+DECODE_BACKENDS = ("auto", "opencv", "ffmpeg")
+
+SEEK_MIN_DURATION = 60          # "auto" seeks instead of decoding everything above this (seconds)
+SEEK_CANDIDATES_PER_FRAME = 4   # Candidate positions visited per frame we may keep
+SEEK_GRAB_DISTANCE = 30         # Closer than this, grab() forward instead of seeking
+
+SEGMENT_WORKERS = os.cpu_count() or 1
+
+DEFAULT_MAX_FRAMES = 8          # Floor for the duration-based frame allocation
+
+PROXY_SIZE = (160, 90)          # (width, height) of the plane motion/scene scores are computed on
+
+
+def _proxy_gray(frame, proxy_size):
+    """
+    Small uint8 grayscale plane used for motion/scene scoring.
+
+    Downscaling the BGR frame before the colour conversion keeps the
+    per-frame cost independent of the source resolution. A proxy_size of
+    None scores on the full-resolution plane.
+    """
+    if proxy_size is not None:
+        frame = cv2.resize(frame, proxy_size, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+
+def _diff_scores(gray, prev_gray):
+    # |a - b| on uint8 via absdiff equals the float64 difference, so a
+    # single saturating diff serves both the motion and the scene score
+    diff = cv2.absdiff(gray, prev_gray)
+    motion_score = scene_score = float(np.mean(diff))
+    return motion_score, scene_score
+
+
+def _key_motion(packet, selected_gray):
+    """
+    Motion against the previously kept frame, None for the first one.
+
+    Measured on the full-resolution planes, like motion_risk_score: kept
+    frames are few, and the low-resolution proxy averages away the fine
+    motion that stage 1's thresholds were tuned on.
+    """
+    if selected_gray is None:
+        return None
+    return _diff_scores(packet.gray, selected_gray)[0]
+
+
+def _timestamp(frame_idx, fps):
+    return frame_idx / fps if fps > 0 else None
+
+
+def _seek_to(cap, frame_idx, next_pos):
+    """Position cap so its next read returns frame_idx; next_pos is the frame it would return now (None if unknown)"""
+    if next_pos is None or frame_idx < next_pos or frame_idx - next_pos > SEEK_GRAB_DISTANCE:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+    else:
+        # Short hop: cheaper to decode forward than to seek to a keyframe
+        while next_pos < frame_idx and cap.grab():
+            next_pos += 1
+
+
+def _sequential_scan(cap, selected_frames, fps, motion_thresh, scene_thresh,
+                     min_gap, max_frames, hash_index, timeline, forced_gap, proxy_size,
+                     first_idx=0, end_idx=None):
+    """
+    Decode every frame in order and score it against its predecessor, yielding selections.
+
+    first_idx is the index of the frame the capture returns next; the scan
+    stops before end_idx when one is given.
+    """
     prev_gray = None
-    frame_idx = 0
-    last_selected = -min_gap
-    
-    # Frame deduplication using structural similarity
-    frame_history = deque(maxlen=5)  # Keep last 5 frames for comparison
-    
-    def is_similar_to_selected(frame, selected_frames, threshold=0.95):
-        """Check if frame is too similar to already selected frames"""
-        if not selected_frames:
-            return False
-            
-        frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        frame_gray = cv2.resize(frame_gray, (64, 64))  # Resize for faster comparison
-        
-        for selected_frame in selected_frames[-3:]:  # Compare with last 3 selected frames
-            selected_gray = cv2.cvtColor(selected_frame, cv2.COLOR_BGR2GRAY)
-            selected_gray = cv2.resize(selected_gray, (64, 64))
-            
-            # Calculate structural similarity
-            correlation = cv2.matchTemplate(frame_gray, selected_gray, cv2.TM_CCOEFF_NORMED)
-            max_corr = np.max(correlation)
-            
-            if max_corr > threshold:
-                return True
-        
-        return False
-
-    while cap.isOpened():
+    selected_gray = None  # Full-resolution plane of the last kept frame
+    frame_idx = first_idx
+    last_selected = first_idx - min_gap
+
+    while cap.isOpened() and (end_idx is None or frame_idx < end_idx):
         ret, frame = cap.read()
         if not ret:
             break
 
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray = _proxy_gray(frame, proxy_size)
 
         if prev_gray is not None:
-            diff = cv2.absdiff(gray, prev_gray)
-            motion_score = np.mean(diff)
-
-            scene_score = np.mean(
-                np.abs(gray.astype("float") - prev_gray.astype("float"))
-            )
+            motion_score, scene_score = _diff_scores(gray, prev_gray)
+            timeline.record(frame_idx, motion_score, scene_score)
 
             # Enhanced criteria with frame deduplication
             should_select = (
                 motion_score > motion_thresh or
                 scene_score > scene_thresh or
-                frame_idx - last_selected >= (duration * fps / max_frames if duration > 0 else 45)  # Less frequent forced selection
+                frame_idx - last_selected >= forced_gap  # Less frequent forced selection
             )
-            
+
             if should_select and frame_idx - last_selected >= min_gap:
                 # Check for similarity with already selected frames
-                if not is_similar_to_selected(frame, selected_frames, similarity_thresh):
-                    selected_frames.append(frame)
+                packet = FramePacket(frame, frame_idx, _timestamp(frame_idx, fps))
+                if not hash_index.is_duplicate(packet.dhash):
+                    selected_frames.append(packet)
+                    hash_index.add(packet.dhash)
+                    timeline.select(frame_idx, _key_motion(packet, selected_gray))
+                    selected_gray = packet.gray
                     last_selected = frame_idx
                     print(f"📹 Selected frame {frame_idx} (motion: {motion_score:.1f}, scene: {scene_score:.1f})")
+                    yield packet
                 else:
                     print(f"⏭️  Skipping similar frame {frame_idx}")
 
@@ -98,16 +124,362 @@ def smart_sample(
         if len(selected_frames) >= max_frames:
             break
 
-    cap.release()
-    
+
+def _seek_scan(cap, selected_frames, fps, total_frames, motion_thresh, scene_thresh,
+               min_gap, max_frames, hash_index, timeline, forced_gap, proxy_size):
+    """
+    Visit only evenly spaced candidate positions using container seeking.
+
+    Each candidate is decoded together with its successor (grab/retrieve) so
+    motion is still measured between adjacent frames, while the scene score
+    compares consecutive candidates. Decode cost scales with the number of
+    candidates instead of the length of the video. Selections are yielded.
+    """
+    n_candidates = min(total_frames, max_frames * SEEK_CANDIDATES_PER_FRAME)
+    step = total_frames / n_candidates
+    positions = sorted({int(i * step) for i in range(n_candidates)})
+
+    prev_gray = None
+    selected_gray = None  # Full-resolution plane of the last kept frame
+    last_selected = -min_gap
+    next_pos = 0  # Index of the frame the decoder will return next
+
+    for frame_idx in positions:
+        _seek_to(cap, frame_idx, next_pos)
+        ret, frame = cap.read()
+        if not ret:
+            break
+        next_pos = frame_idx + 1
+
+        gray = _proxy_gray(frame, proxy_size)
+
+        # Motion against the immediately following frame
+        motion_score = 0.0
+        if cap.grab():
+            next_pos += 1
+            ret, next_frame = cap.retrieve()
+            if ret:
+                next_gray = _proxy_gray(next_frame, proxy_size)
+                motion_score, _ = _diff_scores(next_gray, gray)
+
+        if prev_gray is not None:
+            _, scene_score = _diff_scores(gray, prev_gray)
+            timeline.record(frame_idx, motion_score, scene_score)
+
+            should_select = (
+                motion_score > motion_thresh or
+                scene_score > scene_thresh or
+                frame_idx - last_selected >= forced_gap
+            )
+
+            if should_select and frame_idx - last_selected >= min_gap:
+                packet = FramePacket(frame, frame_idx, _timestamp(frame_idx, fps))
+                if not hash_index.is_duplicate(packet.dhash):
+                    selected_frames.append(packet)
+                    hash_index.add(packet.dhash)
+                    timeline.select(frame_idx, _key_motion(packet, selected_gray))
+                    selected_gray = packet.gray
+                    last_selected = frame_idx
+                    print(f"📹 Selected frame {frame_idx} (motion: {motion_score:.1f}, scene: {scene_score:.1f})")
+                    yield packet
+                else:
+                    print(f"⏭️  Skipping similar frame {frame_idx}")
+
+        prev_gray = gray
+
+        if len(selected_frames) >= max_frames:
+            break
+
+
+def _ffmpeg_scan(video_path, ffmpeg_path, selected_frames, fps, size, motion_thresh, scene_thresh,
+                 min_gap, max_frames, hash_index, timeline, forced_gap, proxy_size, threads):
+    """
+    Sequential scan with decoding, scaling and candidate selection done by ffmpeg.
+
+    ffmpeg emits every min_gap-th frame plus its own scene-change hits, so
+    motion and scene are scored between consecutive candidates rather than
+    adjacent frames, and kept frames are the downscaled ones. Selections
+    are yielded; returns the number of frames ffmpeg delivered.
+    """
+    prev_gray = None
+    selected_gray = None  # Full-resolution plane of the last kept frame
+    last_selected = -min_gap
+    count = 0
+
+    frames = ffmpeg_frames(video_path, size, every=min_gap, scene_thresh=scene_thresh / 255,
+                           threads=threads, ffmpeg_path=ffmpeg_path)
+    try:
+        for pts_time, frame in frames:
+            if pts_time is not None and fps > 0:
+                frame_idx = int(round(pts_time * fps))
+            else:
+                frame_idx = count * min_gap
+            count += 1
+
+            gray = _proxy_gray(frame, proxy_size)
+
+            if prev_gray is not None:
+                motion_score, scene_score = _diff_scores(gray, prev_gray)
+                timeline.record(frame_idx, motion_score, scene_score)
+
+                should_select = (
+                    motion_score > motion_thresh or
+                    scene_score > scene_thresh or
+                    frame_idx - last_selected >= forced_gap
+                )
+
+                if should_select and frame_idx - last_selected >= min_gap:
+                    packet = FramePacket(frame, frame_idx, pts_time)
+                    if not hash_index.is_duplicate(packet.dhash):
+                        selected_frames.append(packet)
+                        hash_index.add(packet.dhash)
+                        timeline.select(frame_idx, _key_motion(packet, selected_gray))
+                        selected_gray = packet.gray
+                        last_selected = frame_idx
+                        print(f"📹 Selected frame {frame_idx} (motion: {motion_score:.1f}, scene: {scene_score:.1f})")
+                        yield packet
+                    else:
+                        print(f"⏭️  Skipping similar frame {frame_idx}")
+
+            prev_gray = gray
+
+            if len(selected_frames) >= max_frames:
+                break
+    except RuntimeError as e:
+        print(f"⚠️  {str(e)}")
+    finally:
+        frames.close()
+
+    return count
+
+
+def _scan_segment(task):
+    """
+    Worker-process entry point: sequentially scan frames [start, end).
+
+    Decoding starts one frame early so the first frame of the segment has a
+    predecessor to be scored against. Returns the (index, dHash) of every
+    candidate and the segment's MotionTimeline; frames are not sent back.
+    """
+    (video_path, start, end, fps, motion_thresh, scene_thresh, min_gap,
+     max_frames, similarity_thresh, forced_gap, proxy_size) = task
+
+    cap = cv2.VideoCapture(video_path)
+    first_idx = max(start - 1, 0)
+    if first_idx > 0:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, first_idx)
+
+    candidates = []
+    timeline = MotionTimeline()
+    try:
+        for packet in _sequential_scan(cap, [], fps, motion_thresh, scene_thresh, min_gap,
+                                       max_frames, HashIndex(similarity_thresh), timeline,
+                                       forced_gap, proxy_size, first_idx, end):
+            candidates.append((packet.index, packet.dhash))
+    finally:
+        cap.release()
+    return candidates, timeline
+
+
+def _segmented_scan(cap, video_path, selected_frames, fps, total_frames, motion_thresh, scene_thresh,
+                    min_gap, max_frames, hash_index, timeline, forced_gap, proxy_size, workers):
+    """
+    Split the timeline into contiguous segments scanned by separate processes.
+
+    Each worker opens its own VideoCapture and returns only candidate
+    indices and hashes. Candidates are merged in time order under the
+    global min_gap and duplicate rules and thinned evenly to max_frames so
+    the selection covers the whole video; only those frames are then
+    decoded again here, from `cap`. Selections are yielded once all
+    segments are done.
+    """
+    bounds = [int(i * total_frames / workers) for i in range(workers + 1)]
+    tasks = [
+        (video_path, bounds[i], bounds[i + 1], fps, motion_thresh, scene_thresh, min_gap,
+         max_frames, hash_index.threshold, forced_gap, proxy_size)
+        for i in range(workers) if bounds[i] < bounds[i + 1]
+    ]
+
+    # Spawned, not forked: callers such as analyze_video already run thread
+    # pools and torch in this process
+    with ProcessPoolExecutor(max_workers=len(tasks), mp_context=multiprocessing.get_context("spawn")) as executor:
+        segments = list(executor.map(_scan_segment, tasks))
+
+    for _, segment_timeline in segments:
+        timeline.extend(segment_timeline)
+
+    survivors = []
+    last_selected = -min_gap
+    for frame_idx, frame_hash in (c for candidates, _ in segments for c in candidates):
+        if frame_idx - last_selected < min_gap:
+            continue
+        if hash_index.is_duplicate(frame_hash):
+            print(f"⏭️  Skipping similar frame {frame_idx} (across segments)")
+            continue
+        hash_index.add(frame_hash)
+        survivors.append(frame_idx)
+        last_selected = frame_idx
+
+    if len(survivors) > max_frames:
+        step = len(survivors) / max_frames
+        survivors = [survivors[int(i * step)] for i in range(max_frames)]
+
+    selected_gray = None
+    next_pos = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    for frame_idx in survivors:
+        _seek_to(cap, frame_idx, next_pos)
+        ret, frame = cap.read()
+        if not ret:
+            print(f"⚠️  Could not decode selected frame {frame_idx}")
+            next_pos = None
+            continue
+        next_pos = frame_idx + 1
+
+        packet = FramePacket(frame, frame_idx, _timestamp(frame_idx, fps))
+        selected_frames.append(packet)
+        timeline.select(frame_idx, _key_motion(packet, selected_gray))
+        selected_gray = packet.gray
+        yield packet
+
+
+def smart_sample_stream(
+    video_path,
+    motion_thresh=15,   # Lower threshold for better sensitivity
+    scene_thresh=25,    # Lower threshold for scene change detection
+    min_gap=10,         # Larger gap to avoid similar frames
+    max_frames=None,    # Frame cap; None allocates by duration (at least DEFAULT_MAX_FRAMES)
+    similarity_thresh=0.95,  # Similarity threshold for frame deduplication
+    mode="auto",        # "sequential" decodes every frame, "seek" jumps between candidates,
+                        # "segmented" (opt-in) decodes every frame across worker processes
+    proxy_size=PROXY_SIZE,  # (width, height) scoring plane; None scores at full resolution
+    backend="opencv",   # "ffmpeg" pipes sequential scans through ffmpeg, "auto" uses it when installed
+    threads=FFMPEG_THREADS, # ffmpeg decoder/filter threads (0 = one per core)
+    workers=SEGMENT_WORKERS,  # Processes for "segmented" scans; 1 disables segmenting
+    timeline=None       # MotionTimeline filled with every scored frame's motion/scene values
+):
+    """
+    Yield key frames as soon as they are selected.
+
+    Each item is a FramePacket carrying the source frame index and its
+    timestamp, so callers can start inference while decoding continues.
+    """
+    if mode not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode: {mode!r} (expected one of {SAMPLING_MODES})")
+    if backend not in DECODE_BACKENDS:
+        raise ValueError(f"Unknown decode backend: {backend!r} (expected one of {DECODE_BACKENDS})")
+
+    cap = cv2.VideoCapture(video_path)
+
+    # Get video duration to adjust sampling strategy
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    duration = total_frames / fps if fps > 0 else 0
+
+    # More conservative frame allocation to avoid redundancy; an explicit cap
+    # from the caller (e.g. a latency budget) is used as given
+    if max_frames is None:
+        max_frames = DEFAULT_MAX_FRAMES
+        if duration > 0:
+            if duration <= 10:      # Very short videos
+                target_frames = min(3, total_frames)
+            elif duration <= 30:    # Short videos
+                target_frames = min(5, total_frames)
+            elif duration <= 60:    # 1 minute videos
+                target_frames = min(8, total_frames)
+            elif duration <= 180:   # 3 minute videos
+                target_frames = min(12, total_frames)
+            else:                   # Long videos
+                target_frames = min(15, total_frames)
+
+            max_frames = max(target_frames, max_frames)
+
+    # Seeking needs a reliable frame count; fall back to decoding everything otherwise
+    if mode == "auto":
+        mode = "seek" if duration > SEEK_MIN_DURATION else "sequential"
+    if mode == "seek" and total_frames <= 0:
+        mode = "sequential"
+    # Segmenting is opt-in ("auto" seeks long videos instead) and needs a frame count
+    if mode == "segmented" and (total_frames <= 0 or workers < 2):
+        mode = "sequential"
+
+    forced_gap = duration * fps / max_frames if duration > 0 else 45
+    selected_frames = []
+    hash_index = HashIndex(similarity_thresh)  # Near-duplicate check against every kept frame
+    if timeline is None:
+        timeline = MotionTimeline()
+
+    # ffmpeg only replaces the full decode; seeking stays on OpenCV
+    ffmpeg_path = find_ffmpeg() if backend != "opencv" and mode == "sequential" else None
+    if backend == "ffmpeg" and mode == "sequential" and ffmpeg_path is None:
+        print("⚠️  ffmpeg not found, falling back to OpenCV decoding")
+
+    try:
+        if ffmpeg_path is not None:
+            size = output_size(int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                               int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            decoded = yield from _ffmpeg_scan(video_path, ffmpeg_path, selected_frames, fps, size,
+                                              motion_thresh, scene_thresh, min_gap, max_frames,
+                                              hash_index, timeline, forced_gap, proxy_size, threads)
+            if decoded:
+                mode = "ffmpeg"
+            else:
+                print("⚠️  ffmpeg decoded no frames, falling back to OpenCV decoding")
+                yield from _sequential_scan(cap, selected_frames, fps, motion_thresh, scene_thresh,
+                                            min_gap, max_frames, hash_index, timeline, forced_gap, proxy_size)
+        elif mode == "segmented":
+            yield from _segmented_scan(cap, video_path, selected_frames, fps, total_frames, motion_thresh,
+                                       scene_thresh, min_gap, max_frames, hash_index, timeline, forced_gap,
+                                       proxy_size, workers)
+        elif mode == "seek":
+            yield from _seek_scan(cap, selected_frames, fps, total_frames, motion_thresh, scene_thresh,
+                                  min_gap, max_frames, hash_index, timeline, forced_gap, proxy_size)
+        else:
+            yield from _sequential_scan(cap, selected_frames, fps, motion_thresh, scene_thresh,
+                                        min_gap, max_frames, hash_index, timeline, forced_gap, proxy_size)
+    finally:
+        cap.release()
+
     # If no frames were selected (e.g., very short video), take at least 1 frame
     if not selected_frames:
         cap = cv2.VideoCapture(video_path)
         ret, frame = cap.read()
+        cap.release()
         if ret:
-            selected_frames.append(frame)
+            packet = FramePacket(frame, 0, 0.0)
+            selected_frames.append(packet)
+            timeline.select(0)
             print(f"📹 Selected single frame (no motion detected)")
-        cap.release()
-    
-    print(f"🎯 Selected {len(selected_frames)} unique frames from {total_frames} total frames")
+            yield packet
+
+    print(f"🎯 Selected {len(selected_frames)} unique frames from {total_frames} total frames ({mode} mode)")
+
+
+def smart_sample(
+    video_path,
+    motion_thresh=15,
+    scene_thresh=25,
+    min_gap=10,
+    max_frames=None,
+    similarity_thresh=0.95,
+    mode="auto",
+    proxy_size=PROXY_SIZE,
+    backend="opencv",
+    threads=FFMPEG_THREADS,
+    workers=SEGMENT_WORKERS,
+    timeline=None,
+    return_indices=False    # Also return the source index of every selected frame
+):
+    """
+    Select key frames from a video.
+
+    Returns a list of FramePacket objects so downstream stages share the
+    colour conversions computed for each frame. See smart_sample_stream
+    for the parameters and a generator that yields frames as they are chosen.
+    """
+    selected_frames = list(smart_sample_stream(
+        video_path, motion_thresh, scene_thresh, min_gap, max_frames,
+        similarity_thresh, mode, proxy_size, backend, threads, workers, timeline
+    ))
+    if return_indices:
+        return selected_frames, [packet.index for packet in selected_frames]
     return selected_frames
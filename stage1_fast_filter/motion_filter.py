@@ -1,16 +1,18 @@
 import cv2
 import numpy as np
 
+from stage0_sampling.frame_packet import as_packet
+
 def motion_risk_score(frames):
     if len(frames) < 2:
         return 0.0
 
     scores = []
 
-    prev_gray = cv2.cvtColor(frames[0], cv2.COLOR_BGR2GRAY)
+    prev_gray = as_packet(frames[0]).gray
 
     for frame in frames[1:]:
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray = as_packet(frame).gray
         diff = cv2.absdiff(gray, prev_gray)
         score = np.mean(diff)
         scores.append(score)
@@ -21,7 +23,8 @@ def motion_risk_score(frames):
 
 def fast_filter(frames,
                 motion_threshold=35,    # Increased from 22
-                darkness_threshold=60):
+                darkness_threshold=60,
+                timeline=None):         # Stage 0 MotionTimeline; reused instead of diffing frames
     # Handle empty frames case
     if not frames:
         return False, {
@@ -29,11 +32,16 @@ def fast_filter(frames,
             "dark_ratio": 0.0
         }
     
-    motion_score = motion_risk_score(frames)
+    if timeline is not None and len(timeline):
+        # Key-frame to key-frame motion already measured by the sampler
+        key_motion = timeline.key_motion
+        motion_score = float(np.mean(key_motion)) if len(key_motion) else 0.0
+    else:
+        motion_score = motion_risk_score(frames)
 
     dark_frames = 0
     for f in frames:
-        gray = cv2.cvtColor(f, cv2.COLOR_BGR2GRAY)
+        gray = as_packet(f).gray
         if np.mean(gray) < darkness_threshold:
             dark_frames += 1
 
@@ -0,0 +1,84 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from stage2_vision.blip_scene import batch_process_frames
+
+MAX_BATCH_SIZE = 16     # Frames per BLIP generate call
+MAX_WAIT = 0.05         # Seconds a frame waits for others to join its batch
+
+
+class BlipBatcher:
+    """
+    In-process micro-batching service in front of batch_process_frames.
+
+    Frames submitted by concurrent callers (e.g. several analyze_video runs
+    in one process) are collected until MAX_BATCH_SIZE frames are queued or
+    the oldest has waited MAX_WAIT, then captioned with a single generate
+    call. Each caller gets a Future per frame; it resolves to the caption,
+    or to None if BLIP failed for that batch.
+    """
+
+    def __init__(self, max_batch_size=MAX_BATCH_SIZE, max_wait=MAX_WAIT, backend=None):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.backend = backend
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="blip-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, frame):
+        future = Future()
+        if frame is None:
+            future.set_result(None)  # Would misalign the shared batch
+        else:
+            self._queue.put((frame, future))
+        return future
+
+    def caption(self, frames):
+        """Caption frames through the shared batches; blocks until all are done"""
+        futures = [self.submit(frame) for frame in frames]
+        return [future.result() for future in futures]
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            frames = [frame for frame, _ in batch]
+            try:
+                descriptions = batch_process_frames(frames, self.backend)
+            except Exception as e:
+                print(f"⚠️  BLIP batch failed: {str(e)}")
+                descriptions = []
+
+            # batch_process_frames returns [] (or drops frames) on failure
+            if len(descriptions) != len(batch):
+                descriptions = [None] * len(batch)
+
+            for (_, future), description in zip(batch, descriptions):
+                future.set_result(description)
+
+
+_blip_batcher = None
+_blip_batcher_lock = threading.Lock()
+
+
+def get_blip_batcher():
+    global _blip_batcher
+    with _blip_batcher_lock:
+        if _blip_batcher is None:
+            _blip_batcher = BlipBatcher()
+    return _blip_batcher
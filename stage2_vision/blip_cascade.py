@@ -0,0 +1,92 @@
+import threading
+
+from stage0_sampling.frame_hash import hamming
+from stage0_sampling.frame_packet import as_packet
+
+BLIP_MODES = ("cascade", "all")
+
+# Cheap-signal gates above which a frame is always captioned
+SKIN_GATE = 0.15            # Same skin share that marks a human present in signals_builder
+MOTION_GATE = 35            # Motion against the preceding frame (the sampler's per-frame score, not stage 1's key-frame average)
+SUSPICIOUS_POSE = ("hands_near_face", "hands_near_chest", "raised_arms")
+SHOT_HASH_DISTANCE = 16     # dHash bits between consecutive key frames that start a new shot
+
+
+def is_suspicious(results):
+    """True unless the cheap detector results are confidently uninformative"""
+    if results is None:
+        return True  # Detectors failed; nothing to vouch for the frame
+    pose = results.get("pose") or {}
+    return bool(
+        results.get("blood")
+        or results.get("fire")
+        or results.get("skin_ratio", 0.0) >= SKIN_GATE
+        or results.get("motion", 0.0) >= MOTION_GATE
+        or any(pose.get(k, False) for k in SUSPICIOUS_POSE)
+    )
+
+
+class BlipCascade:
+    """
+    Decides which sampled frames are sent to BLIP.
+
+    In "cascade" mode the first key frame of every shot is captioned as its
+    representative, and any other frame only when its cheap signals (skin,
+    blood, fire, motion, pose) are suspicious. Skipped frames are captioned
+    after all if stage 1 flags the whole video via escalate(). "all" mode
+    captions every frame, as before, for comparison.
+
+    admit_sampled() must be called in stream order; admit_signals() and
+    escalate() may be called from any thread.
+    """
+
+    def __init__(self, mode="cascade"):
+        if mode not in BLIP_MODES:
+            raise ValueError(f"Unknown BLIP mode: {mode!r} (expected one of {BLIP_MODES})")
+        self.mode = mode
+        self.frames = 0
+        self.shots = 0
+        self._lock = threading.Lock()
+        self._captioned = set()
+        self._skipped = []
+        self._escalated = mode == "all"
+        self._last_hash = None
+
+    def admit_sampled(self, idx, frame):
+        """Called as a frame is sampled; True if it should be captioned now"""
+        self.frames += 1
+        if self.mode == "cascade":
+            frame_hash = as_packet(frame).dhash
+            new_shot = self._last_hash is None or hamming(frame_hash, self._last_hash) > SHOT_HASH_DISTANCE
+            self._last_hash = frame_hash
+            if not new_shot:
+                return False
+            self.shots += 1
+
+        with self._lock:
+            self._captioned.add(idx)
+        return True
+
+    def admit_signals(self, idx, results):
+        """Called with a frame's detector results (None on failure); True if it should be captioned now"""
+        with self._lock:
+            if idx in self._captioned:
+                return False
+            if self._escalated or is_suspicious(results):
+                self._captioned.add(idx)
+                return True
+            self._skipped.append(idx)
+            return False
+
+    def escalate(self):
+        """Caption every remaining frame; returns the indices skipped so far"""
+        with self._lock:
+            self._escalated = True
+            skipped, self._skipped = self._skipped, []
+            self._captioned.update(skipped)
+        return skipped
+
+    def summary(self):
+        with self._lock:
+            captioned = len(self._captioned)
+        return {"mode": self.mode, "frames": self.frames, "shots": self.shots, "captioned": captioned}
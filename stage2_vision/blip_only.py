@@ -1,12 +1,13 @@
-from stage2_vision.blip_scene import batch_process_frames
+from signals.vocabulary import match_keywords
+from stage2_vision.blip_scene import caption_frames
 
 # Object detection using BLIP-1 descriptions only (batch optimized)
 def detect_objects_blip_only(frames):
     """
     Object detection using only BLIP-1 descriptions (batch processing)
     """
-    # Get all descriptions at once
-    descriptions = batch_process_frames(frames)
+    # Shared captions: the first caller runs BLIP, the second reuses them
+    descriptions = caption_frames(frames)
     
     all_risky_objects = []
     all_safe_objects = []
@@ -15,42 +16,41 @@ def detect_objects_blip_only(frames):
         risky_objects = []
         safe_objects = []
         
-        desc_lower = description.lower()
+        keywords = match_keywords(description)
         
         # Risk objects detection
-        if any(word in desc_lower for word in ["gun", "weapon", "knife", "rifle", "pistol"]):
-            if "knife" in desc_lower and ("cooking" in desc_lower or "food" in desc_lower):
+        if "weapon" in keywords:
+            if "knife" in keywords and "knife_food" in keywords:
                 # Kitchen knife - safe context
                 safe_objects.append("knife")
             else:
                 # Weapon or dangerous knife
                 risky_objects.append("knife")
         
-        if any(word in desc_lower for word in ["gun", "rifle", "pistol"]):
+        if "firearm" in keywords:
             risky_objects.append("gun")
         
         # Vehicle and crash detection
-        if any(word in desc_lower for word in ["car", "vehicle", "truck", "automobile"]):
-            if any(word in desc_lower for word in ["crash", "accident", "collision", "wreck", "smash", "hit"]):
+        if "vehicle" in keywords:
+            if "collision" in keywords:
                 risky_objects.append("vehicle_crash")
                 risky_objects.append("accident")
             else:
                 safe_objects.append("vehicle")
         
         # Fire and explosion detection
-        if any(word in desc_lower for word in ["fire", "flame", "explosion", "burning"]):
+        if "fire_object" in keywords:
             risky_objects.append("fire")
         
         # Violence detection
-        if any(word in desc_lower for word in ["fight", "attack", "violence", "assault", "punch"]):
+        if "violence_object" in keywords:
             risky_objects.append("violence")
         
         # Safe objects detection (but exclude if crash detected)
-        crash_detected = any(word in desc_lower for word in ["crash", "accident", "collision", "wreck"])
-        if not crash_detected:
-            if any(word in desc_lower for word in ["tomato", "vegetable", "food", "cooking", "kitchen"]):
+        if "crash" not in keywords:
+            if "food_object" in keywords:
                 safe_objects.extend(["food", "vegetable"])
-                if "cooking" in desc_lower or "kitchen" in desc_lower:
+                if "cooking_object" in keywords:
                     safe_objects.append("kitchen")
         
         all_risky_objects.extend(risky_objects)
@@ -67,20 +67,20 @@ def classify_scene_blip_only(frames):
     """
     Scene classification using only BLIP-1 descriptions (batch processing)
     """
-    # Get all descriptions at once
-    descriptions = batch_process_frames(frames)
+    # Shared captions: the first caller runs BLIP, the second reuses them
+    descriptions = caption_frames(frames)
     
     all_scene_results = []
     all_scene_types = {"kitchen": False, "outdoor": False, "indoor": False}
     
     for description in descriptions:
-        desc_lower = description.lower()
+        keywords = match_keywords(description)
         
         # Scene type detection
         scene_types = {
-            "kitchen": any(word in desc_lower for word in ["kitchen", "cooking", "food", "tomatoes", "vegetables"]),
-            "outdoor": any(word in desc_lower for word in ["woods", "outdoor", "outside", "nature", "wood", "trees", "mountain", "field"]),
-            "indoor": any(word in desc_lower for word in ["kitchen", "room", "inside", "indoor", "home", "building"])
+            "kitchen": "kitchen_scene" in keywords,
+            "outdoor": "outdoor_scene" in keywords,
+            "indoor": "indoor_scene" in keywords
         }
         
         # Aggregate scene types
@@ -88,19 +88,8 @@ def classify_scene_blip_only(frames):
             all_scene_types[key] |= scene_types[key]
         
         # Direct risk/safety classification based on keywords
-        risk_keywords = ["gun", "weapon", "knife", "blood", "attack", "fight", "violent", "threatening", "harm", "screaming", "fear", "abuse", "accident", "crash", "fire"]
-        safety_keywords = ["cooking", "food", "kitchen", "vegetables", "tomatoes", "meal", "preparing", "household", "daily"]
-        
-        risk_score = 0.0
-        safety_score = 0.0
-        
-        for keyword in risk_keywords:
-            if keyword in desc_lower:
-                risk_score += 0.3
-                
-        for keyword in safety_keywords:
-            if keyword in desc_lower:
-                safety_score += 0.3
+        risk_score = 0.3 * keywords.count("scene_risk")
+        safety_score = 0.3 * keywords.count("scene_safety")
         
         # Cap scores at 1.0
         risk_score = min(risk_score, 1.0)
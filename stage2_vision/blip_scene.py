@@ -1,27 +1,92 @@
-import torch
 import warnings
 import sys
 import os
+import json
 import traceback
 from contextlib import redirect_stdout, redirect_stderr
-from transformers import BlipProcessor, BlipForConditionalGeneration
-import cv2
-from PIL import Image
 import logging
 
+import cv2
+import numpy as np
+
+from stage0_sampling.frame_packet import as_packet
+from stage2_vision.caption_cache import CAPTION_CACHE_THRESHOLD, get_caption_cache
+
+# torch, transformers and PIL are imported on first use, so importing this
+# module (e.g. via blip_only) stays cheap for tools that never caption
+
 # Suppress warnings
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 logging.getLogger("transformers").setLevel(logging.ERROR)
 os.environ['HF_HUB_DISABLE_TELEMETRY'] = '1'
 
-_blip_model = None
-_blip_processor = None
+BLIP_MODEL_ID = "Salesforce/blip-image-captioning-base"
+BLIP_BACKENDS = ("fp32", "int8")
+INFERENCE_CONFIG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "config", "inference.json")
+
+_blip_models = {}  # backend -> (model, processor)
+
+
+def load_inference_config():
+    """Read config/inference.json; the BLIP_BACKEND environment variable overrides it"""
+    config = {
+        "blip_backend": "fp32",
+        "blip_mode": "cascade",
+        "blip_preprocessing": "opencv",
+        "caption_cache": True,
+        "caption_cache_threshold": CAPTION_CACHE_THRESHOLD,
+        "vision_executor": "threads",
+    }
+    if os.path.exists(INFERENCE_CONFIG):
+        with open(INFERENCE_CONFIG) as f:
+            config.update(json.load(f))
+    config["blip_backend"] = os.environ.get("BLIP_BACKEND", config["blip_backend"])
+    return config
+
+
+def _load_processor():
+    from transformers import BlipProcessor
+    return BlipProcessor.from_pretrained(
+        BLIP_MODEL_ID,
+        use_fast=False  # Avoid fast processor warning
+    )
+
+
+def _load_fp32(device):
+    from transformers import BlipForConditionalGeneration
+    return BlipForConditionalGeneration.from_pretrained(
+        BLIP_MODEL_ID,
+        tie_word_embeddings=False  # Avoid tie weights warning
+    ).to(device)
+
+
+def _load_int8():
+    # Dynamic int8 quantization of every Linear layer in the vision encoder
+    # and text decoder; CPU only
+    import torch
+    model = _load_fp32("cpu").eval()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
 
+def get_blip_model(backend=None):
+    """
+    Load (once) and return the BLIP model and processor.
+
+    backend is "fp32" (PyTorch) or "int8" (dynamically quantized PyTorch);
+    None uses config/inference.json. Falls back to fp32 if int8 cannot load.
+    """
+    config = load_inference_config()
+    backend = backend or config["blip_backend"]
+    if backend not in BLIP_BACKENDS:
+        raise ValueError(f"Unknown BLIP backend: {backend!r} (expected one of {BLIP_BACKENDS})")
+
+    if backend not in _blip_models:
+        import torch
+        from budget.thread_budget import get_thread_budget
 
-def get_blip_model():
-    global _blip_model, _blip_processor
-    if _blip_model is None:
+        get_thread_budget().apply_torch()
         device = "cuda" if torch.cuda.is_available() else "cpu"
         
         # Suppress all output during model loading
@@ -29,68 +94,192 @@ def get_blip_model():
             warnings.simplefilter("ignore")
             with redirect_stdout(open(os.devnull, 'w')):
                 with redirect_stderr(open(os.devnull, 'w')):
-                    _blip_processor = BlipProcessor.from_pretrained(
-                        "Salesforce/blip-image-captioning-base",
-                        use_fast=False  # Avoid fast processor warning
-                    )
-                    _blip_model = BlipForConditionalGeneration.from_pretrained(
-                        "Salesforce/blip-image-captioning-base",
-                        tie_word_embeddings=False  # Avoid tie weights warning
-                    ).to(device)
-    return _blip_model, _blip_processor
-
-
-def batch_process_frames(frames):
+                    processor = _load_processor()
+                    try:
+                        if backend == "int8":
+                            model = _load_int8()
+                        else:
+                            model = _load_fp32(device)
+                    except Exception as e:
+                        if backend == "fp32":
+                            raise
+                        load_error = e
+                        model = None
+
+        if model is None:
+            # Remembered, so later calls do not retry the failed load every batch
+            print(f"⚠️  BLIP {backend} backend unavailable ({load_error}), using fp32")
+            _blip_models[backend] = get_blip_model("fp32")
+            return _blip_models[backend]
+        _blip_models[backend] = (model, processor)
+    return _blip_models[backend]
+
+
+def encode_images(model, pixel_values):
+    """
+    One vision-encoder pass: (image_embeds, L2-normalised pooled embeddings
+    as numpy), or None when the model does not expose its vision encoder.
+    image_embeds can be captioned with generate_from_embeds() without
+    running the encoder again.
+    """
+    import torch
+    vision_model = getattr(model, "vision_model", None)
+    if vision_model is None:
+        return None
+    with torch.no_grad():
+        outputs = vision_model(pixel_values=pixel_values)
+        pooled = torch.nn.functional.normalize(outputs.pooler_output, dim=-1).float().cpu().numpy()
+        return outputs.last_hidden_state, pooled
+
+
+def generate_from_embeds(model, image_embeds, **generate_kwargs):
+    """
+    BlipForConditionalGeneration.generate() from precomputed image embeddings.
+
+    Same decoder call generate() makes after its own vision pass: a
+    [BOS] prompt, full attention over the image tokens and [SEP] as end of
+    sequence.
+    """
+    import torch
+    text_config = model.config.text_config
+    input_ids = torch.full((image_embeds.shape[0], 1), text_config.bos_token_id,
+                           dtype=torch.long, device=image_embeds.device)
+    image_attention_mask = torch.ones(image_embeds.shape[:-1], dtype=torch.long, device=image_embeds.device)
+    return model.text_decoder.generate(
+        input_ids=input_ids,
+        eos_token_id=text_config.sep_token_id,
+        pad_token_id=text_config.pad_token_id,
+        encoder_hidden_states=image_embeds,
+        encoder_attention_mask=image_attention_mask,
+        **generate_kwargs
+    )
+
+
+def preprocess_frames(frames, processor, method="opencv"):
+    """
+    BGR frames -> (N, 3, H, W) float32 pixel_values for BLIP.
+
+    "opencv" resizes each frame straight to the model input size with
+    OpenCV (INTER_AREA when shrinking, like PIL's antialiased resampling;
+    bicubic when enlarging) into one uint8 batch, then applies the
+    rescale, BGR->RGB swap and mean/std normalisation to the whole batch
+    through per-channel lookup tables. "processor" is the original PIL +
+    BlipProcessor path.
+    """
+    if method == "processor":
+        from PIL import Image
+        images = [Image.fromarray(as_packet(frame).rgb) for frame in frames]
+        return processor(images, return_tensors="np")["pixel_values"].astype(np.float32)
+
+    image_processor = processor.image_processor
+    height, width = image_processor.size["height"], image_processor.size["width"]
+    batch = np.empty((len(frames), height, width, 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        image = as_packet(frame).image
+        shrink = image.shape[0] >= height and image.shape[1] >= width
+        batch[i] = cv2.resize(image, (width, height),
+                              interpolation=cv2.INTER_AREA if shrink else cv2.INTER_CUBIC)
+
+    # Inputs are uint8, so x * rescale / std - mean / std is a 256-entry
+    # table per RGB channel, gathered straight into channels-first layout
+    std = np.asarray(image_processor.image_std, dtype=np.float32)
+    mean = np.asarray(image_processor.image_mean, dtype=np.float32)
+    levels = np.arange(256, dtype=np.float32) * np.float32(image_processor.rescale_factor)
+    tables = (levels[None, :] - mean[:, None]) / std[:, None]
+
+    pixel_values = np.empty((len(frames), 3, height, width), dtype=np.float32)
+    for channel in range(3):
+        np.take(tables[channel], batch[..., 2 - channel], out=pixel_values[:, channel])  # BGR -> RGB
+    return pixel_values
+
+
+def batch_process_frames(frames, backend=None, use_cache=None):
     """
     True batch processing for maximum speed with error handling
+
+    Frames whose vision embedding is nearly identical to a previously
+    captioned one reuse that caption from the caption cache and skip
+    generation; use_cache=None follows config/inference.json.
     """
     if not frames:
         return []
     
     try:
-        model, processor = get_blip_model()
+        import torch
+
+        config = load_inference_config()
+        backend = backend or config["blip_backend"]
+        if use_cache is None:
+            use_cache = config["caption_cache"]
+        model, processor = get_blip_model(backend)
         device = model.device
         
         # Prepare all frames at once with error handling
-        batch_images = []
+        valid_frames = []
         for i, frame in enumerate(frames):
-            try:
-                if frame is None:
-                    print(f"⚠️  Frame {i} is None, skipping")
-                    continue
-                    
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                image = Image.fromarray(frame_rgb)
-                batch_images.append(image)
-            except Exception as e:
-                print(f"⚠️  Error processing frame {i}: {str(e)}")
+            if frame is None:
+                print(f"⚠️  Frame {i} is None, skipping")
                 continue
+            valid_frames.append(frame)
         
-        if not batch_images:
+        if not valid_frames:
             print("❌ No valid frames to process")
             return []
         
         # Process entire batch at once with timeout protection
-        print(f"🔄 Processing batch of {len(batch_images)} frames...")
-        inputs = processor(batch_images, return_tensors="pt", padding=True).to(device)
-        
+        print(f"🔄 Processing batch of {len(valid_frames)} frames...")
+        pixel_values = torch.from_numpy(
+            preprocess_frames(valid_frames, processor, config["blip_preprocessing"])
+        ).to(device)
+
+        # Look frames up in the caption cache; only misses reach the text
+        # decoder, which reuses the encoder output computed for the lookup
+        cache = image_embeds = None
+        descriptions = [None] * len(valid_frames)
+        if use_cache:
+            encoded = encode_images(model, pixel_values)
+            if encoded is not None:
+                image_embeds, embeddings = encoded
+                cache = get_caption_cache(backend, threshold=config["caption_cache_threshold"])
+                hashes = [as_packet(frame).dhash for frame in valid_frames]
+                descriptions = cache.lookup(embeddings, hashes)
+
+        misses = [i for i, description in enumerate(descriptions) if description is None]
+        if not misses:
+            print(f"♻️  Reused {len(valid_frames)} cached captions")
+            return descriptions
+        if len(misses) < len(valid_frames):
+            print(f"♻️  Reused {len(valid_frames) - len(misses)} cached captions")
+
         with torch.no_grad():
             try:
-                outputs = model.generate(**inputs, max_length=20, num_beams=1, do_sample=False)
+                if image_embeds is not None:
+                    outputs = generate_from_embeds(model, image_embeds[misses], max_length=20,
+                                                   num_beams=1, do_sample=False)
+                else:
+                    outputs = model.generate(pixel_values=pixel_values[misses], max_length=20,
+                                             num_beams=1, do_sample=False)
             except Exception as e:
                 print(f"⚠️  BLIP generation error: {str(e)}")
                 # Fallback to individual processing
-                return _fallback_individual_processing(batch_images, processor, model, device)
+                for i, description in zip(misses, _fallback_individual_processing(
+                        pixel_values[misses], processor, model)):
+                    descriptions[i] = description
+                return descriptions
             
         # Decode all results with error handling
-        descriptions = []
-        for i, output in enumerate(outputs):
+        for i, output in zip(misses, outputs):
             try:
                 description = processor.decode(output, skip_special_tokens=True)
-                descriptions.append(description)
+                if cache is not None:
+                    cache.add(embeddings[i], hashes[i], description)
             except Exception as e:
                 print(f"⚠️  Error decoding output {i}: {str(e)}")
-                descriptions.append("error in description")
+                description = "error in description"
+            descriptions[i] = description
+
+        if cache is not None:
+            cache.save_later()
         
         return descriptions
         
@@ -100,16 +289,40 @@ def batch_process_frames(frames):
         return []
 
 
-def _fallback_individual_processing(batch_images, processor, model, device):
+def caption_frames(frames):
+    """
+    BLIP descriptions for frames, generated once per frame.
+
+    Captions are memoized on each FramePacket, so object detection and scene
+    classification over the same frames share a single BLIP pass; only
+    frames without a caption yet are sent to the model, through the shared
+    BlipBatcher so concurrent callers are captioned together.
+    """
+    from stage2_vision.blip_batcher import get_blip_batcher
+
+    packets = [as_packet(frame) for frame in frames if frame is not None]
+    missing = [packet for packet in packets if packet.caption is None]
+
+    if missing:
+        descriptions = get_blip_batcher().caption(missing)
+        for packet, description in zip(missing, descriptions):
+            packet.caption = description
+
+    return [packet.caption for packet in packets if packet.caption is not None]
+
+
+def _fallback_individual_processing(pixel_values, processor, model):
     """Fallback to individual frame processing if batch fails"""
+    import torch
+
     print("🔄 Falling back to individual frame processing...")
     descriptions = []
     
-    for i, image in enumerate(batch_images):
+    for i in range(len(pixel_values)):
         try:
-            inputs = processor(image, return_tensors="pt").to(device)
             with torch.no_grad():
-                output = model.generate(**inputs, max_length=20, num_beams=1, do_sample=False)
+                output = model.generate(pixel_values=pixel_values[i:i + 1], max_length=20,
+                                        num_beams=1, do_sample=False)
             description = processor.decode(output[0], skip_special_tokens=True)
             descriptions.append(description)
         except Exception as e:
@@ -122,18 +335,18 @@ def quick_classify(frame):
     """
     Quick classification without predefined labels (optimized)
     """
+    import torch
+
     model, processor = get_blip_model()
     device = model.device
 
-    # Convert OpenCV → PIL
-    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    image = Image.fromarray(frame_rgb)
-
-    # Generate description (optimized)
-    inputs = processor(image, return_tensors="pt").to(device)
+    # Resize and normalise with OpenCV
+    pixel_values = torch.from_numpy(
+        preprocess_frames([frame], processor, load_inference_config()["blip_preprocessing"])
+    ).to(device)
     
     with torch.no_grad():
-        out = model.generate(**inputs, max_length=20, num_beams=1)  # Faster generation
+        out = model.generate(pixel_values=pixel_values, max_length=20, num_beams=1)  # Faster generation
         description = processor.decode(out[0], skip_special_tokens=True)
     
     return description
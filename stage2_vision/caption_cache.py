@@ -0,0 +1,166 @@
+import atexit
+import json
+import os
+import threading
+
+import numpy as np
+
+from stage0_sampling.frame_hash import hamming
+
+CAPTION_CACHE_DIR = "~/.cache/smart_moderator"
+CAPTION_CACHE_SIZE = 20000          # Embeddings kept; least recently used are replaced beyond this
+CAPTION_CACHE_THRESHOLD = 0.995     # Cosine similarity at which a cached caption may be reused
+CAPTION_CACHE_HASH_DISTANCE = 4     # ...and at most this many differing dHash bits (near-identical pixels)
+CAPTION_CACHE_SAVE_INTERVAL = 60    # Seconds between background saves of a changed cache
+
+
+class CaptionCache:
+    """
+    Nearest-neighbour cache from BLIP image embeddings to captions.
+
+    A flat numpy index of L2-normalised pooled vision-encoder embeddings:
+    lookups are one matrix-vector product. The pooled embedding threshold
+    is not calibrated against caption agreement, and a false hit reuses
+    another frame's caption, so a hit needs both a best cosine similarity
+    of at least `threshold` and a frame dHash within `hash_distance` bits
+    of that entry's, i.e. a near-identical image. The index is bounded
+    with LRU replacement and persisted to an .npz file by a background
+    timer (save_later()) and at exit, never on the captioning thread.
+    """
+
+    def __init__(self, path, max_entries=CAPTION_CACHE_SIZE, threshold=CAPTION_CACHE_THRESHOLD,
+                 hash_distance=CAPTION_CACHE_HASH_DISTANCE):
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.hash_distance = hash_distance
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Serializes file writes, which run outside _lock
+        self._embeddings = None     # (capacity, dim) float32; first len(captions) rows used
+        self._hashes = np.zeros(0, dtype=np.uint64)
+        self._captions = []
+        self._last_used = np.zeros(0, dtype=np.int64)
+        self._clock = 0
+        self._dirty = False
+        self._save_timer = None
+        self._load()
+        atexit.register(self.save)
+
+    def __len__(self):
+        return len(self._captions)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as data:
+                embeddings = data["embeddings"].astype(np.float32)
+                hashes = data["hashes"].astype(np.uint64)
+                captions = json.loads(str(data["captions"]))
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable caption cache {self.path}: {str(e)}")
+            return
+        keep = min(len(captions), self.max_entries)
+        self._embeddings = embeddings[:keep]
+        self._hashes = hashes[:keep]
+        self._captions = captions[:keep]
+        self._last_used = np.arange(keep, dtype=np.int64)
+        self._clock = keep
+
+    def lookup(self, embeddings, hashes):
+        """Cached caption per embedding row / frame dHash, or None where no entry is close enough"""
+        results = [None] * len(embeddings)
+        with self._lock:
+            if not self._captions:
+                return results
+            similarities = embeddings @ self._embeddings[:len(self._captions)].T
+            for i, row in enumerate(similarities):
+                # Most similar entry above the threshold whose frame hash also matches
+                candidates = np.flatnonzero(row >= self.threshold)
+                for j in candidates[np.argsort(-row[candidates])]:
+                    if hamming(hashes[i], int(self._hashes[j])) <= self.hash_distance:
+                        results[i] = self._captions[j]
+                        self._clock += 1
+                        self._last_used[j] = self._clock
+                        break
+        return results
+
+    def add(self, embedding, frame_hash, caption):
+        with self._lock:
+            self._clock += 1
+            if self._embeddings is None or self._embeddings.shape[1] != embedding.shape[0]:
+                self._embeddings = np.zeros((0, embedding.shape[0]), dtype=np.float32)
+                self._hashes = np.zeros(0, dtype=np.uint64)
+                self._captions = []
+                self._last_used = np.zeros(0, dtype=np.int64)
+
+            size = len(self._captions)
+            if size < self.max_entries:
+                if size == len(self._embeddings):
+                    self._grow(min(self.max_entries, max(64, 2 * size)))
+                slot = size
+                self._captions.append(caption)
+            else:
+                slot = int(self._last_used[:size].argmin())  # Evict the least recently used entry
+                self._captions[slot] = caption
+
+            self._embeddings[slot] = embedding
+            self._hashes[slot] = frame_hash
+            self._last_used[slot] = self._clock
+            self._dirty = True
+
+    def _grow(self, capacity):
+        size = len(self._captions)
+        embeddings = np.zeros((capacity, self._embeddings.shape[1]), dtype=np.float32)
+        embeddings[:size] = self._embeddings[:size]
+        hashes = np.zeros(capacity, dtype=np.uint64)
+        hashes[:size] = self._hashes[:size]
+        last_used = np.zeros(capacity, dtype=np.int64)
+        last_used[:size] = self._last_used[:size]
+        self._embeddings, self._hashes, self._last_used = embeddings, hashes, last_used
+
+    def save_later(self, delay=CAPTION_CACHE_SAVE_INTERVAL):
+        """Save on a background timer within `delay` seconds, unless a save is already scheduled"""
+        with self._lock:
+            if not self._dirty or self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(delay, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def save(self):
+        with self._save_lock:
+            # Snapshot under the lock; the slow file write does not block lookups
+            with self._lock:
+                self._save_timer = None
+                if not self._dirty or self._embeddings is None:
+                    return
+                size = len(self._captions)
+                embeddings = self._embeddings[:size].copy()
+                hashes = self._hashes[:size].copy()
+                captions = json.dumps(self._captions)
+                self._dirty = False
+
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = self.path + ".tmp.npz"
+                np.savez(tmp_path, embeddings=embeddings, hashes=hashes, captions=captions)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"⚠️  Could not save caption cache {self.path}: {str(e)}")
+                with self._lock:
+                    self._dirty = True
+
+
+_caption_caches = {}
+_caption_caches_lock = threading.Lock()
+
+
+def get_caption_cache(backend, cache_dir=CAPTION_CACHE_DIR,
+                      max_entries=CAPTION_CACHE_SIZE, threshold=CAPTION_CACHE_THRESHOLD):
+    """One cache per BLIP backend, since their embeddings are not interchangeable"""
+    with _caption_caches_lock:
+        if backend not in _caption_caches:
+            path = os.path.join(cache_dir, f"caption_cache_{backend}.npz")
+            _caption_caches[backend] = CaptionCache(path, max_entries, threshold)
+    return _caption_caches[backend]
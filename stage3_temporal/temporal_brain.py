@@ -1,11 +1,17 @@
 from collections import deque
 
+import numpy as np
+
+IMPACT_MIN_FRAMES = 3   # Dense motion bursts shorter than this (hard cuts, keyframe spikes) are ignored
+IMPACT_WINDOW = 5       # Frames pooled per dense sample, so a peak is compared with its surroundings
+
 
 class TemporalBrain:
     def __init__(self, window_size=5):
         self.window_size = window_size
         self.memory = deque(maxlen=window_size)
         self.motion_history = []
+        self.dense_motion = None
 
     def add_frame_result(
         self,
@@ -35,6 +41,13 @@ class TemporalBrain:
         self.motion_history.append(motion_score)
         self.memory.append(frame_data)
 
+    def add_motion_timeline(self, timeline):
+        """Use the dense per-frame motion from stage 0 for impact detection"""
+        indices = timeline.indices
+        # Seek scans only score sparse candidates; those are not per-frame motion
+        if len(indices) > 1 and np.median(np.diff(indices)) == 1:
+            self.dense_motion = timeline.motion
+
     # ---------- LEGACY INTENT (still useful) ----------
     def intent_score(self):
         if len(self.memory) < self.window_size:
@@ -58,21 +71,43 @@ class TemporalBrain:
 
     # ---------- CRASH / IMPACT DETECTION ----------
     def detect_impact(self):
-        if len(self.motion_history) < 3:
+        if self.dense_motion is None:
+            motion = np.asarray(self.motion_history, dtype=np.float64)
+        else:
+            motion = _sustained_motion(self.dense_motion)
+        if len(motion) < 3:
             return False
 
-        avg_motion = sum(self.motion_history) / len(self.motion_history)
+        avg_motion = motion.mean()
 
-        for i in range(1, len(self.motion_history) - 1):
-            prev_m = self.motion_history[i - 1]
-            curr_m = self.motion_history[i]
-            next_m = self.motion_history[i + 1]
+        prev_m = motion[:-2]
+        curr_m = motion[1:-1]
+        next_m = motion[2:]
 
-            if (
-                curr_m > avg_motion * 1.6 and
-                curr_m > prev_m * 1.4 and
-                curr_m > next_m * 1.4
-            ):
-                return True
-
-        return False
+        peaks = (
+            (curr_m > avg_motion * 1.6) &
+            (curr_m > prev_m * 1.4) &
+            (curr_m > next_m * 1.4)
+        )
+        return bool(peaks.any())
+
+
+def _sustained_motion(dense_motion):
+    """
+    Per-frame motion reduced to sustained movement, pooled over IMPACT_WINDOW frames.
+
+    A hard cut or a keyframe glitch is a one- or two-frame spike in adjacent
+    frame differences. A running median over 2 * IMPACT_MIN_FRAMES - 1
+    frames removes bursts shorter than IMPACT_MIN_FRAMES and keeps longer
+    ones, so only sustained peaks can count as an impact.
+    """
+    motion = np.asarray(dense_motion, dtype=np.float64)
+    width = 2 * IMPACT_MIN_FRAMES - 1
+    if len(motion) >= width:
+        padded = np.pad(motion, IMPACT_MIN_FRAMES - 1, mode="edge")
+        motion = np.median(np.lib.stride_tricks.sliding_window_view(padded, width), axis=1)
+
+    pooled = len(motion) // IMPACT_WINDOW * IMPACT_WINDOW
+    if pooled:
+        motion = motion[:pooled].reshape(-1, IMPACT_WINDOW).mean(axis=1)
+    return motion
@@ -1,30 +1,34 @@
-try:
-    from faster_whisper import WhisperModel
-except ImportError:
-    try:
-        import whisper
-        WhisperModel = whisper.load_model
-    except ImportError:
-        print("⚠️ Warning: Neither faster-whisper nor whisper installed. Audio analysis disabled.")
-        WhisperModel = None
+from budget.thread_budget import get_thread_budget
+from signals.vocabulary import match_keywords
 
 _whisper_model = None
 
-RISK_WORDS = {
-    "kill", "beat", "hit", "die",
-    "blood", "knife", "gun",
-    "threat", "abuse", "fight",
-    "stab", "murder"
-}
+def _whisper_loader(cpu_threads):
+    # Imported on first use; faster-whisper and torch take seconds to import
+    try:
+        from faster_whisper import WhisperModel
+        return lambda: WhisperModel(
+            "tiny",
+            device="cpu",
+            compute_type="float32",
+            cpu_threads=cpu_threads
+        )
+    except ImportError:
+        try:
+            import whisper
+            return lambda: whisper.load_model("tiny", device="cpu")  # Uses torch's thread setting
+        except ImportError:
+            print("⚠️ Warning: Neither faster-whisper nor whisper installed. Audio analysis disabled.")
+            return None
+
 
 def get_whisper_model():
     global _whisper_model
     if _whisper_model is None:
-        _whisper_model = WhisperModel(
-            "tiny",
-            device="cpu",
-            compute_type="float32"
-        )
+        load = _whisper_loader(get_thread_budget().inference_threads)
+        if load is None:
+            raise RuntimeError("Audio analysis disabled: install faster-whisper")
+        _whisper_model = load()
     return _whisper_model
 
 
@@ -35,10 +39,8 @@ def analyze_audio(audio_path):
     risk_hits = 0
 
     for seg in segments:
-        text = seg.text.lower()
-        for word in RISK_WORDS:
-            if word in text:
-                risk_hits += 1
+        # Distinct risk words per segment, e.g. "hit" but not "white"
+        risk_hits += match_keywords(seg.text).count("audio_risk")
 
     if risk_hits == 0:
         score = 0.0
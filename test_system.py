@@ -42,6 +42,21 @@ def test_imports():
     
     return True
 
+def test_policy_imports():
+    """Test that the policy engine imports without heavy dependencies"""
+    print("\n📜 Testing policy engine import time...")
+
+    from profiling.startup_profile import LIGHT_IMPORT_LIMIT, light_import_check
+    seconds, heavy = light_import_check()
+    if heavy:
+        print(f"❌ Policy engine imports heavy modules: {', '.join(heavy)}")
+        return False
+    if seconds > LIGHT_IMPORT_LIMIT:
+        print(f"❌ Policy engine import took {seconds * 1000:.1f} ms (limit {LIGHT_IMPORT_LIMIT * 1000:.0f} ms)")
+        return False
+    print(f"✅ Policy engine imported in {seconds * 1000:.1f} ms")
+    return True
+
 def test_blip_model():
     """Test BLIP model loading"""
     print("\n🧠 Testing BLIP model...")
@@ -90,6 +105,11 @@ def main():
         print("pip install -r requirements.txt")
         return
     
+    # Test policy engine import cost
+    if not test_policy_imports():
+        print("\n❌ Policy import test failed. Keep torch, transformers, mediapipe and whisper imports lazy.")
+        return
+
     # Test BLIP model
     if not test_blip_model():
         print("\n❌ BLIP model test failed. Check model installation.")
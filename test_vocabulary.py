@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Keyword vocabulary test
+Every keyword, and its regular plural, must still match its category
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from signals.vocabulary import VOCABULARY, match_keywords
+from policy_engine.evaluator import evaluate_policies
+from signals.signals_builder import build_signals
+
+
+def plural(word):
+    if word.endswith("y") and word[-2] not in "aeiou":
+        return word[:-1] + "ies"
+    if word.endswith(("s", "x", "z", "ch", "sh", "o")):
+        return word + "es"
+    return word + "s"
+
+
+# Plurals the old substring lists matched, checked by hand
+EXTRA_CASES = (
+    ("a pair of shoes on the ground", "normal_activity"),
+    ("a scene from two movies", "staged"),
+    ("boxes on a table", "normal_activity"),
+    ("tomatoes in a kitchen", "cooking"),
+    ("injuries after a crash", "injury"),
+    ("classrooms in a school", "indoor_scene"),
+)
+
+failures = []
+cases = 0
+for category, terms in VOCABULARY.items():
+    for term in terms:
+        for variant in term.split("|"):
+            words = variant.split()
+            texts = [variant]
+            if not words[-1].endswith("s"):  # Already plural or not a noun ("knives", "tennis")
+                texts.append(" ".join(words[:-1] + [plural(words[-1])]))
+            for text in texts:
+                cases += 1
+                if category not in match_keywords(f"a photo of {text} here"):
+                    failures.append((text, category))
+
+for text, category in EXTRA_CASES:
+    cases += 1
+    if category not in match_keywords(text):
+        failures.append((text, category))
+
+print('🔤 Keyword Vocabulary Test')
+print('=' * 50)
+print(f'Cases: {cases}, failures: {len(failures)}')
+for text, category in failures:
+    print(f'❌ {text!r} does not match {category}')
+
+# A caption the old list called normal activity must not raise dangerous activity
+signals = build_signals(
+    motion_score=45.0, risky_objects=[], safe_objects=[],
+    scene_labels=[("a pair of shoes on the ground", 0.9)], audio_score=0.0,
+    temporal_state={"sustained": False, "impact_detected": False},
+    pose_signals={"human_present": True, "hands_detected": True, "hands_near_face": True,
+                  "hands_near_chest": False, "raised_arms": False},
+    skin_ratio=0.2, blood_visible=False, fire_visible=False,
+    scene_types={"kitchen": False, "outdoor": True, "indoor": False}
+)
+dangerous_activity = evaluate_policies(signals)["dangerous_activity"]["score"]
+print(f'Dangerous activity for "shoes" caption: {dangerous_activity}')
+
+if failures or dangerous_activity > 0.0:
+    print('❌ ISSUE: Vocabulary no longer matches the keyword lists')
+    sys.exit(1)
+print('✅ CORRECT: Every keyword and plural matches its category')
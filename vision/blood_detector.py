@@ -1,6 +1,8 @@
 import cv2
 import numpy as np
 
+from stage0_sampling.frame_packet import as_packet
+
 
 def detect_blood(frame):
     """
@@ -11,8 +13,7 @@ def detect_blood(frame):
     if frame is None:
         return False
 
-    frame = cv2.resize(frame, (320, 240))
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    hsv = as_packet(frame).small_hsv  # 320x240
 
     # Very specific blood-like red ranges (much narrower to avoid food false positives)
     lower_red1 = np.array([0, 150, 80])
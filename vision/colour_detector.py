@@ -0,0 +1,166 @@
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+from stage0_sampling.frame_packet import as_packet
+
+# Same ranges and thresholds as skin_detector, blood_detector and fire_detector
+SKIN_LOWER = np.array((0, 138, 80))         # YCrCb
+SKIN_UPPER = np.array((255, 170, 120))
+SKIN_MIN_REGION = 500                        # Contour area (small-frame pixels) counted as skin
+
+BLOOD_RANGES = (
+    (np.array((0, 150, 80)), np.array((5, 255, 180))),      # HSV, red wraps around hue 0
+    (np.array((175, 150, 80)), np.array((180, 255, 180))),
+)
+BLOOD_MIN_RATIO = 0.05
+BLOOD_MIN_SPLATTERS = 3
+
+FIRE_LOWER = np.array((5, 120, 180))        # HSV
+FIRE_UPPER = np.array((35, 255, 255))
+FIRE_MIN_RATIO = 0.02
+FIRE_MIN_BRIGHTNESS = 100
+FIRE_MIN_PIXELS = 500                        # At the original resolution
+
+_SKIN_KERNEL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+_BLOOD_KERNEL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (9, 9))
+
+ColourStats = namedtuple("ColourStats", "skin_ratio blood fire blood_ratio fire_ratio brightness")
+
+
+def skin_ratio_from_mask(mask):
+    """Share of the frame covered by skin regions larger than SKIN_MIN_REGION"""
+    if not cv2.countNonZero(mask):
+        return 0.0
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _SKIN_KERNEL)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_DILATE, _SKIN_KERNEL)
+
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    large = [contour for contour in contours if cv2.contourArea(contour) > SKIN_MIN_REGION]
+    if not large:
+        return 0.0
+    filtered = np.zeros_like(mask)
+    cv2.drawContours(filtered, large, -1, 255, -1)
+    return round(cv2.countNonZero(filtered) / mask.size, 3)
+
+
+def blood_from_mask(mask):
+    """(blood detected, blood ratio) for a raw red mask"""
+    if not cv2.countNonZero(mask):
+        return False, 0.0
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _BLOOD_KERNEL)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, _BLOOD_KERNEL)
+
+    ratio = cv2.countNonZero(mask) / mask.size
+    if ratio < BLOOD_MIN_RATIO:
+        return False, ratio
+
+    # Liquid splatters are irregular and elongated; food items are more regular
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    splatters = 0
+    for contour in contours:
+        area = cv2.contourArea(contour)
+        if area < 100:
+            continue
+        x, y, w, h = cv2.boundingRect(contour)
+        aspect_ratio = float(w) / h if h > 0 else 0
+        perimeter = cv2.arcLength(contour, True)
+        if perimeter == 0:
+            continue
+        circularity = 4 * np.pi * area / (perimeter * perimeter)
+        if circularity < 0.6 and (aspect_ratio < 0.3 or aspect_ratio > 3.0):
+            splatters += 1
+    return splatters >= BLOOD_MIN_SPLATTERS, ratio
+
+
+def fire_from_stats(fire_ratio, brightness, frame_pixels):
+    """Fire needs enough bright orange pixels in an overall bright frame"""
+    return bool(
+        fire_ratio > FIRE_MIN_RATIO
+        and brightness > FIRE_MIN_BRIGHTNESS
+        and fire_ratio * frame_pixels > FIRE_MIN_PIXELS
+    )
+
+
+def stack_small(frames):
+    """(N, 240, 320, 3) uint8 stack of the frames' shared small views, plus their original pixel counts"""
+    packets = [as_packet(frame) for frame in frames]
+    batch = np.stack([packet.small for packet in packets])
+    frame_pixels = [packet.shape[0] * packet.shape[1] for packet in packets]
+    return batch, frame_pixels
+
+
+def detect_colours_batch(frames, frame_pixels=None, skin=None):
+    """
+    ColourStats for a batch of frames.
+
+    `frames` is a list of frames / packets (None gives empty stats), or an
+    already stacked (N, H, W, 3) uint8 BGR array of 320x240 frames with
+    `frame_pixels` their original sizes (defaults to H * W). HSV and YCrCb
+    conversion and the colour-range masks are one OpenCV call each over
+    the whole stack, and the pixel ratios and brightness are vectorized
+    NumPy reductions over the batch. Only the morphology and contour
+    checks of skin and blood run per frame, and only on frames whose raw
+    mask is not empty. `skin` optionally flags which frames need the skin
+    ratio (e.g. those showing a person); the others report 0.0.
+    """
+    if not isinstance(frames, np.ndarray):
+        valid = [i for i, frame in enumerate(frames) if frame is not None]
+        results = [ColourStats(0.0, False, False, 0.0, 0.0, 0.0)] * len(frames)
+        if valid:
+            batch, valid_pixels = stack_small([frames[i] for i in valid])
+            valid_skin = None if skin is None else [skin[i] for i in valid]
+            for i, stats in zip(valid, detect_colours_batch(batch, valid_pixels, valid_skin)):
+                results[i] = stats
+        return results
+
+    batch = frames
+    count, height, width = batch.shape[:3]
+    if frame_pixels is None:
+        frame_pixels = [height * width] * count
+    if skin is None:
+        skin = [True] * count
+
+    # Colour conversion and range checks are per pixel, so the whole stack
+    # goes through each OpenCV call as one (N * H, W) image
+    rows = batch.reshape(count * height, width, 3)
+    hsv = cv2.cvtColor(rows, cv2.COLOR_BGR2HSV)
+    ycrcb = cv2.cvtColor(rows, cv2.COLOR_BGR2YCrCb)
+
+    skin_masks = cv2.inRange(ycrcb, SKIN_LOWER, SKIN_UPPER).reshape(count, height, width)
+    (lower1, upper1), (lower2, upper2) = BLOOD_RANGES
+    blood_masks = (cv2.inRange(hsv, lower1, upper1) | cv2.inRange(hsv, lower2, upper2)).reshape(count, height, width)
+    fire_masks = cv2.inRange(hsv, FIRE_LOWER, FIRE_UPPER).reshape(count, -1)
+
+    pixels = height * width
+    fire_ratios = np.count_nonzero(fire_masks, axis=1) / pixels
+    brightness = batch.reshape(count, -1).sum(axis=1, dtype=np.uint64) / (pixels * 3)
+
+    results = []
+    for i in range(count):
+        blood, blood_ratio = blood_from_mask(blood_masks[i])
+        fire_ratio, frame_brightness = float(fire_ratios[i]), float(brightness[i])
+        results.append(ColourStats(
+            skin_ratio_from_mask(skin_masks[i]) if skin[i] else 0.0,
+            blood,
+            fire_from_stats(fire_ratio, frame_brightness, frame_pixels[i]),
+            blood_ratio,
+            fire_ratio,
+            frame_brightness,
+        ))
+    return results
+
+
+def detect_colours(frame):
+    """
+    Skin ratio, blood and fire for one frame in a single pass.
+
+    Fused replacement for detect_skin_ratio, detect_blood and detect_fire:
+    the frame is downscaled once (the packet's shared 320x240 view), HSV
+    and YCrCb are computed once, and all three masks and their statistics
+    come from those planes. Fire, which detect_fire evaluates on the
+    full-resolution frame, is measured on the small frame too, with its
+    minimum pixel count scaled back to the original resolution.
+    """
+    return detect_colours_batch([frame])[0]
@@ -1,13 +1,16 @@
 import cv2
 import numpy as np
 
+from stage0_sampling.frame_packet import as_packet
+
 def detect_fire(frame):
     """
     Fire detector with brightness + flicker constraint.
     Avoids food false positives.
     """
 
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    packet = as_packet(frame)
+    hsv = packet.hsv
 
     # Fire-like colors
     lower = np.array([5, 120, 180])
@@ -18,7 +21,7 @@ def detect_fire(frame):
     fire_ratio = np.sum(mask > 0) / mask.size
 
     # 🔒 STRONG FILTERS (ENHANCED)
-    avg_brightness = np.mean(frame)
+    avg_brightness = np.mean(packet.image)
     
     # Additional filter: Check for actual fire-like patterns
     # Fire must be:
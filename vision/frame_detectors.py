@@ -0,0 +1,48 @@
+from vision.colour_detector import detect_colours_batch
+from vision.human_segmenter import detect_human
+
+
+def detect_frames(frames, pose_pool):
+    """
+    Cheap detector results for a batch of frames.
+
+    The human detector runs first: frames without a person skip pose and
+    the skin analysis (pose {} and skin_ratio 0.0, as for a frame where
+    they found nothing), while blood and fire are always checked. The
+    colour detectors run vectorized over the batch; pose runs per frame on
+    an analyzer checked out of `pose_pool`. Each result is a dict with
+    pose, skin_ratio, blood, fire and human, or None where that frame's
+    detectors failed.
+    """
+    humans = []
+    for frame in frames:
+        try:
+            humans.append(detect_human(frame))
+        except Exception as e:
+            print(f"⚠️  Error in human detection: {str(e)}")
+            humans.append(True)  # Fall back to the full analysis
+
+    try:
+        all_colours = detect_colours_batch(frames, skin=humans)
+    except Exception as e:
+        print(f"⚠️  Error in colour detection: {str(e)}")
+        return [None] * len(frames)
+
+    results = []
+    for frame, human, colours in zip(frames, humans, all_colours):
+        try:
+            pose = {}
+            if human:
+                with pose_pool.checkout() as pose_analyzer:
+                    pose = pose_analyzer.analyze(frame)
+            results.append({
+                "pose": pose,
+                "skin_ratio": colours.skin_ratio,
+                "blood": colours.blood,
+                "fire": colours.fire,
+                "human": human,
+            })
+        except Exception as e:
+            print(f"⚠️  Error in frame detectors: {str(e)}")
+            results.append(None)
+    return results
@@ -1,6 +1,54 @@
+import threading
+
+import cv2
+
+from stage0_sampling.frame_packet import as_packet
+from vision.colour_detector import SKIN_LOWER, SKIN_UPPER
+
+HUMAN_SKIN_SHARE = 0.01     # Raw skin-tone share of the small frame taken as a visible face, hands or body
+HOG_WIN_STRIDE = (8, 8)
+HOG_SCALE = 1.1
+
+_detectors = threading.local()  # One HOG detector per thread
+_hog_warning = threading.Event()
+
+
+def _people_detector():
+    """OpenCV's default HOG people detector, or None in builds without it (OpenCV 5, which requirements.txt excludes)"""
+    if not hasattr(_detectors, "hog"):
+        _detectors.hog = None
+        if hasattr(cv2, "HOGDescriptor"):
+            _detectors.hog = cv2.HOGDescriptor()
+            _detectors.hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
+        elif not _hog_warning.is_set():
+            _hog_warning.set()
+            print("⚠️  OpenCV HOG people detector unavailable; assuming humans are present")
+    return _detectors.hog
+
+
 def detect_human(frame):
     """
-    Simple fallback - always assume human present for now
-    TODO: Fix mediapipe integration
+    True if the frame likely shows a person.
+
+    A cheap check tuned for recall, used to skip pose and skin analysis on
+    human-free frames (landscapes, screen recordings, products). It works
+    on the packet's shared 320x240 view: first the share of raw skin-tone
+    pixels (faces, hands, close-ups), then OpenCV's HOG people detector for
+    clothed figures and for monochrome frames, where skin cannot be seen.
+    Frames in OpenCV builds without the HOG detector are still assumed to
+    show a person.
     """
-    return True
+    if frame is None:
+        return False
+
+    packet = as_packet(frame)
+    skin = cv2.inRange(packet.small_ycrcb, SKIN_LOWER, SKIN_UPPER)
+    if cv2.countNonZero(skin) >= HUMAN_SKIN_SHARE * skin.size:
+        return True
+
+    hog = _people_detector()
+    if hog is None:
+        return True
+    gray = cv2.cvtColor(packet.small, cv2.COLOR_BGR2GRAY)
+    boxes, _ = hog.detectMultiScale(gray, winStride=HOG_WIN_STRIDE, scale=HOG_SCALE)
+    return len(boxes) > 0
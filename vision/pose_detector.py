@@ -1,10 +1,14 @@
-import mediapipe as mp
-import cv2
+from stage0_sampling.frame_packet import as_packet
 
 class PoseAnalyzer:
-    def __init__(self):
+    def __init__(self, static_image_mode=True):
+        # Sampled key frames are far apart and reach the workers out of
+        # order, so each is analysed on its own rather than tracked
+        import mediapipe as mp  # Loaded on first use; importing this module stays cheap
+
+        self._landmarks = mp.solutions.pose.PoseLandmark
         self.pose = mp.solutions.pose.Pose(
-            static_image_mode=False,
+            static_image_mode=static_image_mode,
             model_complexity=1,
             enable_segmentation=False,
             min_detection_confidence=0.5,
@@ -20,7 +24,7 @@ class PoseAnalyzer:
             "raised_arms": False
         }
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = as_packet(frame).rgb
         results = self.pose.process(rgb)
 
         if not results.pose_landmarks:
@@ -30,11 +34,11 @@ class PoseAnalyzer:
         signals["human_present"] = True
         signals["hands_detected"] = True
 
-        left_wrist = lm[mp.solutions.pose.PoseLandmark.LEFT_WRIST]
-        right_wrist = lm[mp.solutions.pose.PoseLandmark.RIGHT_WRIST]
-        nose = lm[mp.solutions.pose.PoseLandmark.NOSE]
-        left_shoulder = lm[mp.solutions.pose.PoseLandmark.LEFT_SHOULDER]
-        right_shoulder = lm[mp.solutions.pose.PoseLandmark.RIGHT_SHOULDER]
+        left_wrist = lm[self._landmarks.LEFT_WRIST]
+        right_wrist = lm[self._landmarks.RIGHT_WRIST]
+        nose = lm[self._landmarks.NOSE]
+        left_shoulder = lm[self._landmarks.LEFT_SHOULDER]
+        right_shoulder = lm[self._landmarks.RIGHT_SHOULDER]
 
         if left_wrist.y < nose.y or right_wrist.y < nose.y:
             signals["hands_near_face"] = True
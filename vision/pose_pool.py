@@ -0,0 +1,83 @@
+import threading
+from contextlib import contextmanager
+
+from budget.thread_budget import get_thread_budget
+from vision.pose_detector import PoseAnalyzer
+
+
+class PosePool:
+    """
+    Bounded pool of static-image PoseAnalyzers shared by all frame workers.
+
+    MediaPipe graphs are not thread-safe, so each worker checks out its own
+    analyzer for the frame it is processing and returns it afterwards.
+    Graphs are created on demand up to `max_size` (default: the thread
+    budget's detector threads, the most frame workers that run at once);
+    a worker that finds all of them busy waits for one to be returned.
+    Idle analyzers are kept, so later videos reuse the warm graphs.
+    """
+
+    def __init__(self, max_size=None, factory=PoseAnalyzer):
+        self.max_size = max_size or get_thread_budget().detector_threads
+        self._factory = factory
+        self._idle = []
+        self._created = 0
+        self._available = threading.Condition()
+
+    def __len__(self):
+        return self._created
+
+    def _acquire(self):
+        with self._available:
+            while not self._idle and self._created >= self.max_size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        return self._create()
+
+    def _create(self):
+        # A slot is already reserved in _created; the graph is built outside
+        # the lock, so other workers are not held up
+        try:
+            return self._factory()
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+    def _release(self, pose_analyzer):
+        with self._available:
+            self._idle.append(pose_analyzer)
+            self._available.notify()
+
+    @contextmanager
+    def checkout(self):
+        pose_analyzer = self._acquire()
+        try:
+            yield pose_analyzer
+        finally:
+            self._release(pose_analyzer)
+
+    def warm(self, count=None):
+        """Create analyzers until `count` (default: max_size) exist"""
+        count = min(count or self.max_size, self.max_size)
+        while True:
+            with self._available:
+                if self._created >= count:
+                    return
+                self._created += 1
+            self._release(self._create())
+
+
+_pose_pool = None
+_pose_pool_lock = threading.Lock()
+
+
+def get_pose_pool():
+    global _pose_pool
+    with _pose_pool_lock:
+        if _pose_pool is None:
+            _pose_pool = PosePool()
+    return _pose_pool
@@ -1,6 +1,8 @@
 import cv2
 import numpy as np
 
+from stage0_sampling.frame_packet import as_packet
+
 
 def detect_skin_ratio(frame):
     """
@@ -11,9 +13,7 @@ def detect_skin_ratio(frame):
     if frame is None:
         return 0.0
 
-    frame = cv2.resize(frame, (320, 240))
-
-    ycrcb = cv2.cvtColor(frame, cv2.COLOR_BGR2YCrCb)
+    ycrcb = as_packet(frame).small_ycrcb  # 320x240
 
     # More conservative skin detection ranges
     skin_mask = cv2.inRange(
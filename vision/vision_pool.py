@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from budget.thread_budget import get_thread_budget
+from stage0_sampling.frame_packet import as_packet
+from vision.frame_detectors import detect_frames
+from vision.pose_pool import PosePool
+
+VISION_EXECUTORS = ("threads", "processes")
+
+_worker_poses = None    # Worker-process state: this process's own PoseAnalyzer
+
+
+def _init_worker():
+    global _worker_poses
+    get_thread_budget()  # Single-threaded OpenCV, like the frame threads
+    _worker_poses = PosePool(max_size=1)
+
+
+def _warm_worker():
+    _worker_poses.warm()
+    return os.getpid()
+
+
+def _detect_shared(name, layout):
+    """Worker entry point: run the detectors on the frames laid out in shared memory block `name`"""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        # Zero-copy views; released when detect_frames returns, before the block is closed
+        return detect_frames(
+            [np.ndarray(shape, dtype=np.uint8, buffer=block.buf, offset=offset) for offset, shape in layout],
+            _worker_poses
+        )
+    finally:
+        try:
+            block.close()
+        except BufferError:
+            pass  # A traceback still references the views; the mapping is freed with them
+
+
+class VisionProcessPool:
+    """
+    Runs the per-frame detectors in worker processes instead of threads.
+
+    Contour loops and pose landmark logic hold the GIL, so frame threads
+    only scale so far. Here each batch of frames is copied once into one
+    multiprocessing.shared_memory block, and a worker attaches to it by
+    name and reads the frames in place; only the small result dicts are
+    pickled back. Workers are spawned (not forked, since BLIP and the
+    batcher run threads in the parent) and each keeps its own warm
+    PoseAnalyzer for the lifetime of the pool.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or get_thread_budget().detector_threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+
+    def warm(self):
+        """Start the workers and load their pose graphs; raises if one cannot load"""
+        for future in [self._executor.submit(_warm_worker) for _ in range(self.workers)]:
+            future.result()
+
+    def detect(self, frames):
+        """detect_frames() results for frames, computed in a worker process; blocks until done"""
+        images = [as_packet(frame).image for frame in frames]
+        layout = []
+        size = 0
+        for image in images:
+            layout.append((size, image.shape))
+            size += image.nbytes
+
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            for (offset, shape), image in zip(layout, images):
+                np.ndarray(shape, dtype=np.uint8, buffer=block.buf, offset=offset)[...] = image
+            return self._executor.submit(_detect_shared, block.name, layout).result()
+        finally:
+            block.close()
+            block.unlink()
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+
+_vision_pool = None
+_vision_pool_lock = threading.Lock()
+
+
+def get_vision_pool():
+    global _vision_pool
+    with _vision_pool_lock:
+        if _vision_pool is None:
+            pool = VisionProcessPool()
+            try:
+                pool.warm()
+            except Exception:
+                pool.shutdown()
+                raise
+            _vision_pool = pool
+    return _vision_pool
@@ -0,0 +1,64 @@
+"""
+📨 Moderation worker client
+Sends a video to the running worker daemon and prints the same result as analyze_video.py
+
+Usage: python -m worker.client <video_path> [--no-cache] [--budget SECONDS] [--blip-all] [--vision-processes] [--port PORT]
+"""
+
+import os
+import sys
+import time
+
+from worker.protocol import connect, daemon_address, print_result, read_message, send_message
+
+
+def analyze_remote(video_path, use_cache=True, budget=None, blip_mode=None, vision_executor=None, address=None):
+    """analyze_video() executed by the worker daemon; returns (decision, explanation)"""
+    request = {
+        "video_path": os.path.abspath(video_path),
+        "use_cache": use_cache,
+        "budget": budget,
+        "blip_mode": blip_mode,
+        "vision_executor": vision_executor,
+    }
+    with connect(address or daemon_address()) as sock, sock.makefile("rwb") as stream:
+        send_message(stream, request)
+        response = read_message(stream)
+
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["decision"], response["explanation"]
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("❌ Usage: python -m worker.client <video_path> [--no-cache] [--budget SECONDS] [--blip-all] [--vision-processes] [--port PORT]")
+        sys.exit(1)
+
+    options = sys.argv[2:]
+    budget = float(options[options.index("--budget") + 1]) if "--budget" in options else None
+    port = int(options[options.index("--port") + 1]) if "--port" in options else None
+
+    start_time = time.time()
+    print("\n📥 Loading video:", sys.argv[1])
+    try:
+        decision, explanation = analyze_remote(
+            sys.argv[1],
+            use_cache="--no-cache" not in options,
+            budget=budget,
+            blip_mode="all" if "--blip-all" in options else None,
+            vision_executor="processes" if "--vision-processes" in options else None,
+            address=daemon_address(port)
+        )
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("❌ Moderation daemon is not running; start it with: python -m worker.daemon")
+        sys.exit(1)
+    except RuntimeError as e:
+        print(f"❌ Analysis failed: {str(e)}")
+        sys.exit(1)
+
+    print_result(decision, explanation, time.time() - start_time)
+
+
+if __name__ == "__main__":
+    main()
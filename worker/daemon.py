@@ -0,0 +1,136 @@
+"""
+🟢 Moderation worker daemon
+Keeps BLIP, Whisper and MediaPipe loaded and analyses videos sent by worker.client
+
+Usage: python -m worker.daemon [--port PORT]
+"""
+
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+import traceback
+
+from analyze_video import analyze_video
+from stage2_vision.blip_scene import get_blip_model, load_inference_config
+from stage6_audio.audio_analyzer import get_whisper_model
+from vision.pose_pool import get_pose_pool
+from vision.vision_pool import get_vision_pool
+from worker.protocol import connect, daemon_address, read_message, send_message
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = read_message(self.rfile)
+        except (ConnectionError, ValueError) as e:
+            send_message(self.wfile, {"error": f"Malformed request: {str(e)}"})
+            return
+        send_message(self.wfile, self.server.moderator.run_job(request))
+
+
+class ModerationDaemon:
+    """
+    Long-lived process that keeps every model warm between videos.
+
+    Each connection carries one JSON request, either
+    {"video_path", "use_cache", "budget", "blip_mode", "vision_executor"} or {"ping": true},
+    and is answered with one JSON line holding the decision and
+    explanation (or an "error"). Connections are served on their own
+    threads, so concurrent jobs share BLIP batches through the BlipBatcher.
+    The MediaPipe graphs of the PosePool are created up front and shared
+    by the frame workers of all jobs.
+    """
+
+    def __init__(self, address=None):
+        self.address = address or daemon_address()
+        self.jobs = 0
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        start = time.time()
+        loaders = [("BLIP", get_blip_model), ("Whisper", get_whisper_model),
+                   ("MediaPipe pose", lambda: get_pose_pool().warm())]
+        if load_inference_config()["vision_executor"] == "processes":
+            loaders.append(("vision worker processes", get_vision_pool))
+        for name, load in loaders:
+            try:
+                load()
+                print(f"✅ {name} loaded")
+            except Exception as e:
+                print(f"⚠️  Could not preload {name}: {str(e)}")
+        print(f"🔥 Models warm in {time.time() - start:.2f}s")
+
+    def run_job(self, request):
+        if request.get("ping"):
+            return {"ok": True, "pid": os.getpid(), "jobs": self.jobs}
+
+        video_path = request.get("video_path")
+        if not video_path or not os.path.exists(video_path):
+            return {"error": f"Video not found: {video_path}"}
+
+        start = time.time()
+        try:
+            decision, explanation = analyze_video(
+                video_path,
+                use_cache=request.get("use_cache", True),
+                budget=request.get("budget"),
+                blip_mode=request.get("blip_mode"),
+                vision_executor=request.get("vision_executor")
+            )
+        except Exception as e:
+            traceback.print_exc()
+            return {"error": f"{type(e).__name__}: {str(e)}"}
+
+        with self._lock:
+            self.jobs += 1
+        return {"decision": decision, "explanation": explanation, "seconds": time.time() - start}
+
+    def _claim_socket(self):
+        # Refuse to start twice; remove a socket file left by a crashed daemon
+        if not os.path.exists(self.address):
+            os.makedirs(os.path.dirname(self.address), exist_ok=True)
+            return True
+        try:
+            connect(self.address).close()
+            return False
+        except OSError:
+            os.remove(self.address)
+            return True
+
+    def serve(self):
+        unix = not isinstance(self.address, tuple)
+        if unix and not self._claim_socket():
+            print(f"❌ A daemon is already listening on {self.address}")
+            sys.exit(1)
+
+        self.warm_up()
+        server_class = socketserver.ThreadingUnixStreamServer if unix else socketserver.ThreadingTCPServer
+        server_class.allow_reuse_address = True
+        server_class.daemon_threads = True
+
+        with server_class(self.address, _JobHandler) as server:
+            server.moderator = self
+            if unix:
+                os.chmod(self.address, 0o600)  # Only this user may submit jobs
+            print(f"🟢 Moderation daemon ready on {self.address}")
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # Still clean up the socket
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print("\n🛑 Shutting down")
+            finally:
+                if unix and os.path.exists(self.address):
+                    os.remove(self.address)
+
+
+def main():
+    options = sys.argv[1:]
+    port = int(options[options.index("--port") + 1]) if "--port" in options else None
+    ModerationDaemon(daemon_address(port)).serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import json
+import os
+import socket
+
+from cache.decision_cache import _to_json
+
+DAEMON_SOCKET = os.environ.get(
+    "MODERATOR_SOCKET",
+    os.path.join(os.path.expanduser("~"), ".cache", "smart_moderator", "daemon.sock")
+)
+DAEMON_TCP_ADDRESS = ("127.0.0.1", 8765)   # Used where Unix sockets are unavailable (Windows)
+
+
+def daemon_address(port=None):
+    """Unix socket path where supported, otherwise a localhost (host, port)"""
+    if port is not None or not hasattr(socket, "AF_UNIX"):
+        return (DAEMON_TCP_ADDRESS[0], port or DAEMON_TCP_ADDRESS[1])
+    return DAEMON_SOCKET
+
+
+def connect(address):
+    family = socket.AF_INET if isinstance(address, tuple) else socket.AF_UNIX
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+# Messages are single JSON lines in both directions
+
+def send_message(stream, message):
+    stream.write(json.dumps(message, default=_to_json).encode() + b"\n")
+    stream.flush()
+
+
+def read_message(stream):
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connection closed before a message was received")
+    return json.loads(line)
+
+
+def print_result(decision, explanation, seconds):
+    print("\n================ FINAL RESULT ================")
+    print("📌 DECISION :", decision)
+    print("🧾 DETAILS  :", explanation)
+    print("⏱️  TIME    :", round(seconds, 2), "seconds")
+    print("=============================================\n")